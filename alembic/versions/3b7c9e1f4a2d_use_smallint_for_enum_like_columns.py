@@ -0,0 +1,61 @@
+"""use smallint with check constraints for enum-like columns
+
+Revision ID: 3b7c9e1f4a2d
+Revises: e53eaddda76b
+Create Date: 2026-10-16 09:12:31.418204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7c9e1f4a2d'
+down_revision: Union[str, Sequence[str], None] = 'e53eaddda76b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('invoice', 'client_type',
+               existing_type=sa.INTEGER(),
+               type_=sa.SmallInteger(),
+               existing_nullable=False)
+    op.alter_column('invoice', 'currency',
+               existing_type=sa.INTEGER(),
+               type_=sa.SmallInteger(),
+               existing_nullable=False)
+    op.alter_column('recurrent_bill', 'payment_status',
+               existing_type=sa.INTEGER(),
+               type_=sa.SmallInteger(),
+               existing_nullable=False)
+    op.create_check_constraint(
+        'ck_invoice_client_type', 'invoice', 'client_type BETWEEN 1 AND 3')
+    op.create_check_constraint(
+        'ck_invoice_currency', 'invoice', 'currency BETWEEN 1 AND 4')
+    op.create_check_constraint(
+        'ck_recurrent_bill_payment_status', 'recurrent_bill',
+        'payment_status BETWEEN -1 AND 2')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('ck_recurrent_bill_payment_status',
+                       'recurrent_bill', type_='check')
+    op.drop_constraint('ck_invoice_currency', 'invoice', type_='check')
+    op.drop_constraint('ck_invoice_client_type', 'invoice', type_='check')
+    op.alter_column('recurrent_bill', 'payment_status',
+               existing_type=sa.SmallInteger(),
+               type_=sa.INTEGER(),
+               existing_nullable=False)
+    op.alter_column('invoice', 'currency',
+               existing_type=sa.SmallInteger(),
+               type_=sa.INTEGER(),
+               existing_nullable=False)
+    op.alter_column('invoice', 'client_type',
+               existing_type=sa.SmallInteger(),
+               type_=sa.INTEGER(),
+               existing_nullable=False)
@@ -0,0 +1,39 @@
+"""add trigram indexes for client search
+
+Revision ID: 5e9a1c7d3b24
+Revises: c41e8b7d2a90
+Create Date: 2026-10-16 14:22:08.517904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e9a1c7d3b24'
+down_revision: Union[str, Sequence[str], None] = 'c41e8b7d2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ILIKE '%term%' can only use a pg_trgm GIN index; other dialects keep
+    # the existing btree indexes
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_index('ix_client_name_trgm', 'client', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    op.create_index('ix_client_email_trgm', 'client', ['email'], unique=False, postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+
+    op.drop_index('ix_client_email_trgm', table_name='client')
+    op.drop_index('ix_client_name_trgm', table_name='client')
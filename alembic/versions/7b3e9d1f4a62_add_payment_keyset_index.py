@@ -0,0 +1,28 @@
+"""add payment keyset pagination index
+
+Revision ID: 7b3e9d1f4a62
+Revises: 5e9a1c7d3b24
+Create Date: 2026-10-16 16:41:27.093815
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3e9d1f4a62'
+down_revision: Union[str, Sequence[str], None] = '5e9a1c7d3b24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('payment_date_created_id_idx', 'payment', ['date_created', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('payment_date_created_id_idx', table_name='payment')
@@ -0,0 +1,68 @@
+"""add persisted vat_total column to invoice
+
+Revision ID: 8d2f6a0c5e13
+Revises: 3b7c9e1f4a2d
+Create Date: 2026-10-16 10:41:07.552918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2f6a0c5e13'
+down_revision: Union[str, Sequence[str], None] = '3b7c9e1f4a2d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Mirrors app.utils.invoice_utils.calculate_invoice_totals()['vat_total']:
+# item subtotal, minus fixed/percent discount, plus 7.5% VAT unless the
+# client is a student (client_type = 1). disc_value is free-form text, so
+# only plain numbers are cast; anything else counts as no discount, as it
+# does in calculate_discount().
+BACKFILL_VAT_TOTAL = r"""
+UPDATE invoice AS i
+SET vat_total = ROUND(
+    CASE WHEN i.client_type = 1 THEN t.net ELSE t.net * 1.075 END, 2
+)
+FROM (
+    SELECT d.id,
+        d.subtotal - CASE
+            WHEN d.disc_type = 'fixed' AND d.disc > 0
+            THEN LEAST(d.disc, d.subtotal)
+            WHEN d.disc_type IN ('percent', 'percentage')
+                AND d.disc BETWEEN 0 AND 100
+            THEN d.disc / 100 * d.subtotal
+            ELSE 0
+        END AS net
+    FROM (
+        SELECT inv.id, inv.disc_type,
+            COALESCE(s.subtotal, 0) AS subtotal,
+            CASE
+                WHEN inv.disc_value ~ '^\s*-?\d+(\.\d+)?\s*$'
+                THEN CAST(TRIM(inv.disc_value) AS NUMERIC)
+            END AS disc
+        FROM invoice AS inv
+        LEFT JOIN (
+            SELECT invoice_id, SUM(amount) AS subtotal
+            FROM item
+            GROUP BY invoice_id
+        ) AS s ON s.invoice_id = inv.id
+    ) AS d
+) AS t
+WHERE t.id = i.id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('invoice', sa.Column('vat_total', sa.DECIMAL(precision=15, scale=2), server_default='0', nullable=False))
+    op.execute(BACKFILL_VAT_TOTAL)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('invoice', 'vat_total')
@@ -0,0 +1,28 @@
+"""add payment invoice/reference index
+
+Revision ID: a8c2f5e7b913
+Revises: 7b3e9d1f4a62
+Create Date: 2026-10-16 17:12:44.381920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a8c2f5e7b913'
+down_revision: Union[str, Sequence[str], None] = '7b3e9d1f4a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('payment_invoice_reference_idx', 'payment', ['invoice_id', 'reference_number'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('payment_invoice_reference_idx', table_name='payment')
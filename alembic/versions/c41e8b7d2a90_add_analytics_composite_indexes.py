@@ -0,0 +1,30 @@
+"""add composite indexes for analytics queries
+
+Revision ID: c41e8b7d2a90
+Revises: 8d2f6a0c5e13
+Create Date: 2026-10-16 11:05:52.130447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e8b7d2a90'
+down_revision: Union[str, Sequence[str], None] = '8d2f6a0c5e13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('invoice_status_date_idx', 'invoice', ['status', 'date_value'], unique=False)
+    op.create_index('payment_invoice_status_idx', 'payment', ['invoice_id', 'status'], unique=False, postgresql_include=['amount_paid'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('payment_invoice_status_idx', table_name='payment')
+    op.drop_index('invoice_status_date_idx', table_name='invoice')
@@ -0,0 +1,59 @@
+"""make payment reference unique per invoice
+
+Revision ID: d4f1a6c8e205
+Revises: a8c2f5e7b913
+Create Date: 2026-10-16 17:48:03.225164
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f1a6c8e205'
+down_revision: Union[str, Sequence[str], None] = 'a8c2f5e7b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Blank references were never checked for uniqueness; keep them out
+PAYMENT_REFERENCE_WHERE = "reference_number IS NOT NULL AND reference_number <> ''"
+
+
+# References that would collide under the new index; the old
+# check-then-insert validation was racy, so live tables may hold some
+DUPLICATE_REFERENCES = f"""
+SELECT invoice_id, reference_number, COUNT(*) AS copies
+FROM payment
+WHERE {PAYMENT_REFERENCE_WHERE}
+GROUP BY invoice_id, reference_number
+HAVING COUNT(*) > 1
+ORDER BY invoice_id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    duplicates = op.get_bind().execute(sa.text(DUPLICATE_REFERENCES)).all()
+    if duplicates:
+        listed = ', '.join(
+            f"invoice {row.invoice_id} reference '{row.reference_number}' "
+            f"(x{row.copies})"
+            for row in duplicates[:20]
+        )
+        raise RuntimeError(
+            f"Cannot make payment references unique: {len(duplicates)} "
+            f"duplicated (invoice_id, reference_number) pair(s): {listed}. "
+            "Resolve these payments by hand, then rerun the migration."
+        )
+
+    op.drop_index('payment_invoice_reference_idx', table_name='payment')
+    op.create_index('payment_invoice_reference_uidx', 'payment', ['invoice_id', 'reference_number'], unique=True, postgresql_where=sa.text(PAYMENT_REFERENCE_WHERE), sqlite_where=sa.text(PAYMENT_REFERENCE_WHERE))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('payment_invoice_reference_uidx', table_name='payment')
+    op.create_index('payment_invoice_reference_idx', 'payment', ['invoice_id', 'reference_number'], unique=False)
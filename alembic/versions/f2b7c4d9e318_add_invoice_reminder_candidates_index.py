@@ -0,0 +1,47 @@
+"""add partial index for overdue reminder candidates
+
+Revision ID: f2b7c4d9e318
+Revises: d4f1a6c8e205
+Create Date: 2026-10-16 18:20:36.641057
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7c4d9e318'
+down_revision: Union[str, Sequence[str], None] = 'd4f1a6c8e205'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Same predicate as the overdue reminders task's candidate query
+REMINDER_CANDIDATES_WHERE = (
+    "status NOT IN ('PAID', 'CANCELLED') "
+    "AND send_reminders AND reminder_frequency IS NOT NULL"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        op.create_index('invoice_reminder_candidates_idx', 'invoice', ['invoice_due'], unique=False, sqlite_where=sa.text(REMINDER_CANDIDATES_WHERE))
+        return
+
+    # CONCURRENTLY keeps invoice writable while the index builds; it cannot
+    # run inside the migration transaction
+    with op.get_context().autocommit_block():
+        op.create_index('invoice_reminder_candidates_idx', 'invoice', ['invoice_due'], unique=False, postgresql_where=sa.text(REMINDER_CANDIDATES_WHERE), postgresql_include=['id', 'status', 'send_reminders', 'reminder_frequency', 'reminder_logs'], postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        op.drop_index('invoice_reminder_candidates_idx', table_name='invoice')
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index('invoice_reminder_candidates_idx', table_name='invoice', postgresql_concurrently=True)
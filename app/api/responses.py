@@ -0,0 +1,25 @@
+"""Response helpers for API endpoints."""
+
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def model_response(
+    schema: type[BaseModel],
+    obj: Any,
+    status_code: int = status.HTTP_200_OK
+) -> Response:
+    """
+    Validate an ORM object once and serialize it straight to JSON bytes.
+
+    Returning a Response bypasses FastAPI's response_model pass, so the
+    route's response_model is only used for the OpenAPI docs.
+    """
+
+    return Response(
+        content=schema.model_validate(obj).model_dump_json(),
+        status_code=status_code,
+        media_type="application/json"
+    )
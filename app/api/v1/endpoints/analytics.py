@@ -2,11 +2,11 @@
 """Analytics API endpoints for dashboard statistics."""
 
 import logging
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_user
-from app.config.database import get_db
+from app.config.database import SessionLocal, get_db
 from app.models.user import User
 from app.schemas.analytics import DashboardStats
 from app.services.analytics_service import get_dashboard_stats
@@ -71,7 +71,7 @@ router = APIRouter()
 def get_dashboard_route(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
-) -> DashboardStats:
+) -> Response:
     """
     Get complete dashboard analytics.
 
@@ -84,7 +84,8 @@ def get_dashboard_route(
         extra={"user_id": current_user.id}
     )
 
-    dashboard_data = get_dashboard_stats(db)
+    dashboard_data = get_dashboard_stats(
+        db, session_factory=SessionLocal, user_id=current_user.id)
 
     logger.info(
         "Dashboard stats returned successfully",
@@ -95,4 +96,9 @@ def get_dashboard_route(
         }
     )
 
-    return DashboardStats(**dashboard_data)
+    # Nested rows are already schema instances built by the service
+    stats = DashboardStats.model_construct(**dashboard_data)
+    return Response(
+        content=stats.model_dump_json(),
+        media_type="application/json"
+    )
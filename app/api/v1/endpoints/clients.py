@@ -5,6 +5,7 @@ from app.services.client_service import create_client, delete_client, get_client
 
 from ....config.database import get_db
 from ...dependencies import get_current_user
+from ...responses import model_response
 from ....models.user import User
 from ....schemas.client import ClientCreate, ClientUpdate, ClientResponse, ClientsResponse
 
@@ -16,7 +17,7 @@ def add_client_route(client_data: ClientCreate, db: Session = Depends(get_db), c
     """Create a new client"""
 
     new_client = create_client(client_data, db)
-    return new_client
+    return model_response(ClientResponse, new_client, status.HTTP_201_CREATED)
 
 
 @router.get('/', response_model=ClientsResponse)
@@ -52,7 +53,7 @@ def update_client_route(
     """Update an existing client (partial update)"""
 
     updated_client = update_client(client_id, client_data, db)
-    return updated_client
+    return model_response(ClientResponse, updated_client)
 
 
 @router.delete('/{client_id}', status_code=status.HTTP_204_NO_CONTENT)
@@ -2,6 +2,7 @@ from fastapi import APIRouter, HTTPException, Query, Response, status, Depends
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_user
+from app.api.responses import model_response
 from app.config.database import get_db
 from app.models.invoice import Invoice
 from app.schemas.invoice import InvoiceCreate, InvoicePaginatedResponse, InvoiceResponse, InvoiceStatusUpdate, InvoiceUpdate
@@ -24,7 +25,7 @@ def create_invoice_route(invoice_data: InvoiceCreate, db: Session = Depends(get_
         auto_send_email=True
     )
 
-    return invoice
+    return model_response(InvoiceResponse, invoice, status.HTTP_201_CREATED)
 
 
 @router.get('/', response_model=InvoicePaginatedResponse)
@@ -32,12 +33,14 @@ def get_paginated_invoices_route(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
     search: str | None = None,
+    cursor: int | None = Query(None, ge=1),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
     """Get paginated list of invoices with optional search (client name/email)"""
 
-    return get_invoices_paginated(db, page=page, limit=limit, search=search)
+    return get_invoices_paginated(
+        db, page=page, limit=limit, search=search, cursor=cursor)
 
 
 @router.get("/{invoice_id}", response_model=InvoiceResponse)
@@ -62,7 +65,7 @@ def change_invoice_status_route(invoice_id: int, status_update: InvoiceStatusUpd
         db=db
     )
 
-    return invoice
+    return model_response(InvoiceResponse, invoice)
 
 
 @router.patch("/{invoice_id}", response_model=InvoiceResponse)
@@ -74,7 +77,8 @@ def update_invoice_route(
 ):
     """Partially update an invoice (only mutable fields)."""
 
-    return update_invoice(invoice_id, invoice_update, db)
+    invoice = update_invoice(invoice_id, invoice_update, db)
+    return model_response(InvoiceResponse, invoice)
 
 
 @router.delete("/{invoice_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -101,7 +105,8 @@ def download_invoice_pdf_route(
     try:
         pdf_bytes = generate_invoice_pdf(invoice_id=invoice_id, db=db)
 
-        invoice = db.query(Invoice).filter(Invoice.id == invoice_id).first()
+        # Already in the identity map from the PDF query; no second SELECT
+        invoice = db.get(Invoice, invoice_id)
         filename = f"{invoice.invoice_no}.pdf" if invoice and invoice.invoice_no else f"invoice_{invoice_id}.pdf"
 
         return Response(
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, status
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_user
+from app.api.responses import model_response
 from app.config.database import get_db
 from app.models.user import User
 from app.schemas.item import ItemCreate, ItemResponse, ItemUpdate
@@ -19,7 +20,8 @@ def add_item_to_invoice_route(
     current_user: User = Depends(get_current_user)
 ):
     """Add a new item to an existing invoice"""
-    return add_item_to_invoice(invoice_id, item_data, db)
+    item = add_item_to_invoice(invoice_id, item_data, db)
+    return model_response(ItemResponse, item, status.HTTP_201_CREATED)
 
 
 @router.patch('/{item_id}', response_model=ItemResponse)
@@ -30,7 +32,8 @@ def update_item_route(
     current_user: User = Depends(get_current_user)
 ):
     """Update an existing item (partial update)"""
-    return update_item(item_id, item_data, db)
+    item = update_item(item_id, item_data, db)
+    return model_response(ItemResponse, item)
 
 
 @router.delete('/{item_id}', status_code=status.HTTP_204_NO_CONTENT)
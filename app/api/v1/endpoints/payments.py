@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_current_user
+from app.api.responses import model_response
 from app.config.database import get_db
 from app.models.invoice import Invoice
 from app.schemas.payment import PaymentCreate, PaymentPaginatedResponse, PaymentResponse, PaymentUpdate
@@ -19,7 +20,9 @@ def create_payment_route(
 ):
     """Create a new payment record and update invoice status."""
 
-    return create_payment_and_update_invoice(payment_data=payment_data, db=db)
+    payment = create_payment_and_update_invoice(
+        payment_data=payment_data, db=db)
+    return model_response(PaymentResponse, payment, status.HTTP_201_CREATED)
 
 
 @router.get("/{payment_id}", response_model=PaymentResponse)
@@ -37,12 +40,14 @@ def get_payment_route(
 def get_payments_route(
     page: int = Query(1, ge=1),
     limit: int = Query(10, ge=1, le=100),
+    cursor: int | None = Query(None, ge=1),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
     """Get paginated list of all payments."""
 
-    return get_payments_paginated(db=db, page=page, limit=limit)
+    return get_payments_paginated(
+        db=db, page=page, limit=limit, cursor=cursor)
 
 
 @router.get("/invoice/{invoice_id}", response_model=list[PaymentResponse])
@@ -65,11 +70,12 @@ def update_payment_route(
 ):
     """Update an existing payment (partial update)."""
 
-    return update_payment(
+    payment = update_payment(
         payment_id=payment_id,
         payment_data=payment_data,
         db=db
     )
+    return model_response(PaymentResponse, payment)
 
 
 @router.delete("/{payment_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -58,6 +58,10 @@ class Settings(BaseSettings):
         validation_alias="PASSWORD_RESET_TOKEN_EXPIRATION_MINUTES"
     )
 
+    # Analytics
+    DASHBOARD_CACHE_TTL: int = Field(
+        30, validation_alias="DASHBOARD_CACHE_TTL")
+
     # CORS
     CORS_ORIGINS: str = Field(
         default="http://localhost:3000,http://localhost:8080")
@@ -12,17 +12,50 @@ from app.config.database import init_db
 from app.core.csrf import CSRFMiddleware
 from app.core.exceptions import AppException
 from app.core.rate_limit import limiter
+from app.schemas import (
+    ClientResponse,
+    EmailQueueResponse,
+    EmailReceiptResponse,
+    ExpenseResponse,
+    InvoiceResponse,
+    ItemResponse,
+    PaymentResponse,
+    RecurrentBillResponse,
+    UserResponse,
+)
+from app.schemas.analytics import DashboardStats, RecentInvoiceSummary, RecentPaymentSummary
 
 
 from .config import settings
 from .api.v1 import api_router
 
 
+# Response schemas use defer_build; build them before the first request lands.
+DEFERRED_SCHEMAS = (
+    ClientResponse,
+    EmailQueueResponse,
+    EmailReceiptResponse,
+    ExpenseResponse,
+    InvoiceResponse,
+    ItemResponse,
+    PaymentResponse,
+    RecurrentBillResponse,
+    UserResponse,
+    RecentInvoiceSummary,
+    RecentPaymentSummary,
+    DashboardStats,
+)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan with database and task queue initialization."""
     
     init_db()
+
+    for schema in DEFERRED_SCHEMAS:
+        schema.model_rebuild()
+
     yield
 
 
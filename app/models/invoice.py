@@ -1,6 +1,7 @@
 from datetime import datetime
+from decimal import Decimal
 from typing import TYPE_CHECKING
-from sqlalchemy import BigInteger, Boolean, DateTime, Enum, ForeignKey, Integer, JSON, String, Text, func
+from sqlalchemy import DECIMAL, BigInteger, Boolean, CheckConstraint, DateTime, Enum, ForeignKey, Index, Integer, JSON, SmallInteger, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..config.database import Base
 from enum import Enum as PyEnum
@@ -23,9 +24,40 @@ class InvoiceStatus(str, PyEnum):
     CANCELLED = "cancelled"
 
 
+# Predicate of send_overdue_reminders_task's candidate query (enum names are
+# stored, not values)
+REMINDER_CANDIDATES_WHERE = (
+    "status NOT IN ('PAID', 'CANCELLED') "
+    "AND send_reminders AND reminder_frequency IS NOT NULL"
+)
+
+
 class Invoice(Base):
     __tablename__ = "invoice"
 
+    __table_args__ = (
+        Index('invoice_status_date_idx', 'status', 'date_value'),
+        # Partial index over the overdue reminders task's candidates only
+        Index(
+            'invoice_reminder_candidates_idx',
+            'invoice_due',
+            postgresql_where=text(REMINDER_CANDIDATES_WHERE),
+            sqlite_where=text(REMINDER_CANDIDATES_WHERE),
+            postgresql_include=[
+                'id', 'status', 'send_reminders',
+                'reminder_frequency', 'reminder_logs'
+            ]
+        ),
+        CheckConstraint(
+            'client_type BETWEEN 1 AND 3',
+            name='ck_invoice_client_type'
+        ),
+        CheckConstraint(
+            'currency BETWEEN 1 AND 4',
+            name='ck_invoice_currency'
+        ),
+    )
+
     # Primary key
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
 
@@ -36,8 +68,8 @@ class Invoice(Base):
     date_value: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now())
     invoice_due: Mapped[datetime] = mapped_column(DateTime)
-    client_type: Mapped[int] = mapped_column(Integer)
-    currency: Mapped[int] = mapped_column(Integer)
+    client_type: Mapped[int] = mapped_column(SmallInteger)
+    currency: Mapped[int] = mapped_column(SmallInteger)
     client_id: Mapped[int] = mapped_column(
         BigInteger, ForeignKey('client.id', ondelete='RESTRICT'))
     status: Mapped[InvoiceStatus] = mapped_column(
@@ -61,6 +93,11 @@ class Invoice(Base):
         BigInteger, ForeignKey('recurrent_bill.id', ondelete='SET NULL')
     )
 
+    # Persisted calculate_invoice_totals()['vat_total'], kept in sync on write
+    vat_total: Mapped[Decimal] = mapped_column(
+        DECIMAL(15, 2), default=Decimal('0.00'), server_default='0', nullable=False
+    )
+
     # Tracking fields
     view_count: Mapped[int | None] = mapped_column(Integer, default=0)
     last_view: Mapped[datetime | None] = mapped_column(DateTime)
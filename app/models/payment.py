@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import BigInteger, DECIMAL, DateTime, Enum, ForeignKey, Integer, String, Text, func
+from sqlalchemy import BigInteger, DECIMAL, DateTime, Enum, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..config.database import Base
 from .invoice import Invoice
@@ -36,9 +36,31 @@ class InvoicePaymentState(str, PyEnum):
     UNPAID = "unpaid"
 
 
+# Blank references are allowed any number of times, as before the index
+PAYMENT_REFERENCE_WHERE = "reference_number IS NOT NULL AND reference_number <> ''"
+
+
 class Payment(Base):
     __tablename__ = "payment"
 
+    __table_args__ = (
+        Index(
+            'payment_invoice_status_idx',
+            'invoice_id',
+            'status',
+            postgresql_include=['amount_paid']
+        ),
+        Index('payment_date_created_id_idx', 'date_created', 'id'),
+        Index(
+            'payment_invoice_reference_uidx',
+            'invoice_id',
+            'reference_number',
+            unique=True,
+            postgresql_where=text(PAYMENT_REFERENCE_WHERE),
+            sqlite_where=text(PAYMENT_REFERENCE_WHERE)
+        ),
+    )
+
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
     client_name: Mapped[str] = mapped_column(String(150))
     payment_desc: Mapped[str | None] = mapped_column(Text)
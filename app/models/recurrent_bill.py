@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from decimal import Decimal
-from sqlalchemy import BigInteger, DECIMAL, DateTime, ForeignKey, Index, Integer, String, func
+from sqlalchemy import BigInteger, CheckConstraint, DECIMAL, DateTime, ForeignKey, Index, SmallInteger, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from ..config.database import Base
 from .client import Client
@@ -14,6 +14,10 @@ class RecurrentBill(Base):
 
     __table_args__ = (
         Index('recurrent_bill_args_req', 'id', 'client_id'),
+        CheckConstraint(
+            'payment_status BETWEEN -1 AND 2',
+            name='ck_recurrent_bill_payment_status'
+        ),
     )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, index=True)
@@ -26,7 +30,7 @@ class RecurrentBill(Base):
     date_due: Mapped[datetime] = mapped_column(DateTime)
     date_updated: Mapped[datetime] = mapped_column(
         DateTime, server_default=func.now(), onupdate=func.now())
-    payment_status: Mapped[int] = mapped_column(Integer, default=0)
+    payment_status: Mapped[int] = mapped_column(SmallInteger, default=0)
 
     client: Mapped["Client"] = relationship()
     invoices: Mapped[list["Invoice"]] = relationship(
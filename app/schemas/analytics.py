@@ -45,7 +45,7 @@ class RecentInvoiceSummary(BaseModel):
     status: str
     total_amount: Decimal
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class RecentPaymentSummary(BaseModel):
@@ -57,7 +57,7 @@ class RecentPaymentSummary(BaseModel):
     payment_date: datetime
     invoice_no: str
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class DashboardStats(BaseModel):
@@ -81,6 +81,7 @@ class DashboardStats(BaseModel):
     recent_payments: list[RecentPaymentSummary]
 
     model_config = ConfigDict(
+        defer_build=True,
         json_schema_extra={
             "example": {
                 "total_revenue": "150000.00",
@@ -1,8 +1,28 @@
+import re
 from datetime import datetime
 from pydantic import BaseModel, Field, EmailStr, ConfigDict, field_validator
 from email_validator import validate_email, EmailNotValidError
 
 
+_EMAIL_RE = re.compile(r"^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$")
+
+
+def _normalize_email(value: str) -> str:
+    """Normalize an email, skipping email_validator for plain ASCII addresses."""
+
+    if len(value) <= 254 and _EMAIL_RE.fullmatch(value):
+        local, _, domain = value.rpartition("@")
+        return f"{local}@{domain.lower()}"
+
+    try:
+        validated = validate_email(
+            value, check_deliverability=True, allow_smtputf8=True
+        )
+        return validated.normalized
+    except EmailNotValidError as e:
+        raise ValueError(f"Invalid email address: {str(e)}") from e
+
+
 class ClientBase(BaseModel):
     """Shared fields for client operations"""
 
@@ -17,13 +37,7 @@ class ClientBase(BaseModel):
     def validate_email(cls, value: str) -> str:
         """Validate email deliverability."""
 
-        try:
-            validated = validate_email(
-                value, check_deliverability=True, allow_smtputf8=True
-            )
-            return validated.normalized
-        except EmailNotValidError as e:
-            raise ValueError(f"Invalid email address: {str(e)}") from e
+        return _normalize_email(value)
 
 
 class ClientCreate(ClientBase):
@@ -49,12 +63,7 @@ class ClientUpdate(BaseModel):
         if value is None:
             return None
 
-        try:
-            validated = validate_email(
-                value, check_deliverability=True, allow_smtputf8=True)
-            return validated.normalized
-        except EmailNotValidError as e:
-            raise ValueError(f"Invalid email address: {str(e)}")
+        return _normalize_email(value)
 
 
 class ClientResponse(ClientBase):
@@ -62,7 +71,7 @@ class ClientResponse(ClientBase):
 
     id: int
     date_created: datetime
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class Pagination(BaseModel):
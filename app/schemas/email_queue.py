@@ -22,4 +22,4 @@ class EmailQueueResponse(EmailQueueBase):
     id: int
     date_created: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
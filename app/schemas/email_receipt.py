@@ -22,4 +22,4 @@ class EmailReceiptResponse(EmailReceiptBase):
     counter: int
     last_received: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -31,4 +31,4 @@ class ExpenseResponse(ExpenseBase):
     status: int
     aproved_by: str | None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
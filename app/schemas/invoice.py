@@ -48,7 +48,7 @@ class InvoiceResponse(InvoiceBase):
     last_view: datetime | None
     items: list[ItemResponse] = []
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class PaginationInfo(BaseModel):
@@ -56,6 +56,7 @@ class PaginationInfo(BaseModel):
     limit: int
     total: int
     total_pages: int
+    next_cursor: int | None = None
 
 
 class InvoicePaginatedResponse(BaseModel):
@@ -23,4 +23,4 @@ class ItemResponse(ItemBase):
     amount: Decimal
     invoice_id: int
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
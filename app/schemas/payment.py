@@ -34,7 +34,7 @@ class PaymentResponse(PaymentBase):
     view_count: int
     last_view: datetime | None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
 
 
 class PaginationInfo(BaseModel):
@@ -42,6 +42,7 @@ class PaginationInfo(BaseModel):
     limit: int
     total: int
     total_pages: int
+    next_cursor: int | None = None
 
 
 class PaymentPaginatedResponse(BaseModel):
@@ -28,4 +28,4 @@ class RecurrentBillResponse(RecurrentBillBase):
     date_created: datetime
     date_updated: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
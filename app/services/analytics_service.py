@@ -1,19 +1,248 @@
 """Analytics service for dashboard statistics and business intelligence."""
 
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from decimal import Decimal
 import logging
-from sqlalchemy import func, and_, or_, case, extract
-from sqlalchemy.orm import Session, joinedload
-
+import threading
+import time
+from typing import Any, Optional, TypeVar
+from pydantic import BaseModel
+from sqlalchemy import event, func, and_, or_, case, extract, literal_column, select
+from sqlalchemy.orm import Session, raiseload, selectinload, sessionmaker
+
+from app.config.settings import settings
 from app.models.client import Client
 from app.models.invoice import Invoice, InvoiceStatus
 from app.models.payment import Payment, PaymentStatus
+from app.schemas.analytics import (
+    InvoiceStatusCount,
+    MonthlyRevenue,
+    RecentInvoiceSummary,
+    RecentPaymentSummary,
+    TopClient,
+)
 from app.utils.datetime_utils import get_current_timezone
 
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+UNPAID_STATUSES = [
+    InvoiceStatus.SENT,
+    InvoiceStatus.VIEWED,
+    InvoiceStatus.PARTIALLY_PAID,
+    InvoiceStatus.OVERDUE
+]
+
+
+# Dashboard payloads keyed by (user_id, local date), stored with the
+# monotonic time they were computed at. The cache is per process: with
+# several workers, a write only invalidates the worker that handled it, so
+# the others can serve stats up to DASHBOARD_CACHE_TTL seconds stale.
+_dashboard_cache: dict[tuple[Optional[int], Any], tuple[float, dict]] = {}
+_dashboard_cache_lock = threading.Lock()
+_dashboard_cache_generation = 0
+
+# Session.info flag set by writes whose commit must invalidate the cache
+_DASHBOARD_STALE_KEY = 'dashboard_stale'
+
+
+def invalidate_dashboard_cache() -> None:
+    """Drop cached dashboard stats after a write that affects them."""
+
+    global _dashboard_cache_generation
+
+    with _dashboard_cache_lock:
+        _dashboard_cache.clear()
+        _dashboard_cache_generation += 1
+
+
+def invalidate_dashboard_cache_on_commit(db: Session) -> None:
+    """
+    Drop cached dashboard stats once db's current transaction commits.
+
+    Invalidating before the commit would let a concurrent dashboard request
+    read the pre-commit data and cache it for the full TTL.
+    """
+
+    db.info[_DASHBOARD_STALE_KEY] = True
+
+
+@event.listens_for(Session, 'after_commit')
+def _invalidate_after_commit(session: Session) -> None:
+    if session.info.pop(_DASHBOARD_STALE_KEY, False):
+        invalidate_dashboard_cache()
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _discard_stale_flag(session: Session, previous_transaction: Any) -> None:
+    if not previous_transaction.nested:
+        session.info.pop(_DASHBOARD_STALE_KEY, None)
+
+
+def _dashboard_cache_key(user_id: Optional[int]) -> tuple[Optional[int], Any]:
+    """Key on the local date too, so month windows roll over at midnight."""
+
+    return (user_id, get_current_timezone("Africa/Lagos").date())
+
+
+def _get_cached_dashboard(key: tuple[Optional[int], Any]) -> Optional[dict]:
+    """Return a cached payload for key if it is still within the TTL."""
+
+    with _dashboard_cache_lock:
+        entry = _dashboard_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, data = entry
+        if time.monotonic() - stored_at >= settings.DASHBOARD_CACHE_TTL:
+            del _dashboard_cache[key]
+            return None
+        return data
+
+
+def _store_dashboard(
+    key: tuple[Optional[int], Any],
+    data: dict,
+    generation: int
+) -> None:
+    """Cache data unless a write invalidated the cache while it was computed."""
+
+    with _dashboard_cache_lock:
+        if generation != _dashboard_cache_generation:
+            return
+        now = time.monotonic()
+        expired = [
+            k for k, (stored_at, _) in _dashboard_cache.items()
+            if now - stored_at >= settings.DASHBOARD_CACHE_TTL
+        ]
+        for k in expired:
+            del _dashboard_cache[k]
+        _dashboard_cache[key] = (now, data)
+
+
+def rows_to(cls: type[ModelT], rows: Iterable[Mapping[str, Any]]) -> list[ModelT]:
+    """
+    Build schema instances from trusted query rows without validation.
+
+    Analytics rows come straight from the database, so model_construct
+    is used instead of a per-row model_validate.
+    """
+
+    ctor = cls.model_construct
+    return [ctor(**row) for row in rows]
+
+
+def _lazy_load_guard() -> tuple:
+    """
+    Loader options that make unplanned lazy loads raise instead of
+    silently issuing one query per row. Disabled in DEBUG.
+    """
+
+    if settings.DEBUG:
+        return ()
+
+    return (raiseload('*'),)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Normalize a SQL aggregate result to a 2dp Decimal."""
+
+    return Decimal(str(value or 0)).quantize(Decimal('0.01'))
+
+
+# Per-invoice sum of non-cancelled payments
+_paid_totals = (
+    select(Payment.invoice_id, func.sum(Payment.amount_paid).label('paid'))
+    .where(Payment.status != PaymentStatus.CANCELLED)
+    .group_by(Payment.invoice_id)
+    .subquery()
+)
+
+
+def _month_key(db: Session, column):
+    """SQL expression formatting a datetime column as 'YYYY-MM'."""
+
+    # Inline the format so SELECT and GROUP BY render the same expression
+    if db.get_bind().dialect.name == 'postgresql':
+        return func.to_char(column, literal_column("'YYYY-MM'"))
+
+    return func.strftime(literal_column("'%Y-%m'"), column)
+
+
+def _sum_remaining_balance(db: Session, statuses: list[InvoiceStatus]) -> Decimal:
+    """Sum (invoice total - non-cancelled payments) for invoices in statuses."""
+
+    remaining = Invoice.vat_total - func.coalesce(_paid_totals.c.paid, 0)
+
+    total = db.query(func.sum(remaining))\
+        .select_from(Invoice)\
+        .outerjoin(_paid_totals, _paid_totals.c.invoice_id == Invoice.id)\
+        .filter(Invoice.status.in_(statuses))\
+        .scalar()
+
+    return _to_decimal(total)
+
+
+def _get_status_rollup(db: Session) -> dict[InvoiceStatus, dict]:
+    """
+    Count, total and paid amount per invoice status in a single scan.
+
+    Returns:
+        Dict of status -> {'count', 'total', 'paid'}, where paid excludes
+        cancelled payments
+    """
+
+    rows = db.query(
+        Invoice.status,
+        func.count(Invoice.id).label('count'),
+        func.sum(Invoice.vat_total).label('total'),
+        func.sum(func.coalesce(_paid_totals.c.paid, 0)).label('paid')
+    )\
+        .select_from(Invoice)\
+        .outerjoin(_paid_totals, _paid_totals.c.invoice_id == Invoice.id)\
+        .group_by(Invoice.status)\
+        .all()
+
+    return {
+        row.status: {
+            'count': row.count,
+            'total': _to_decimal(row.total),
+            'paid': _to_decimal(row.paid)
+        }
+        for row in rows
+    }
+
+
+def _summarize_status_rollup(rollup: dict[InvoiceStatus, dict]) -> dict:
+    """Derive the dashboard financial metrics from a status rollup."""
+
+    empty = {'count': 0, 'total': Decimal('0.00'), 'paid': Decimal('0.00')}
+
+    def remaining(status: InvoiceStatus) -> Decimal:
+        entry = rollup.get(status, empty)
+        return entry['total'] - entry['paid']
+
+    return {
+        'total_revenue': rollup.get(InvoiceStatus.PAID, empty)['total'],
+        'outstanding_amount': sum(
+            (remaining(status) for status in UNPAID_STATUSES),
+            Decimal('0.00')
+        ),
+        'overdue_amount': remaining(InvoiceStatus.OVERDUE),
+        'total_invoices': sum(entry['count'] for entry in rollup.values()),
+        'status_breakdown': [
+            {
+                'status': status.value,
+                'count': entry['count'],
+                'total_amount': entry['total']
+            }
+            for status, entry in rollup.items()
+        ]
+    }
+
 
 def get_total_revenue(db: Session) -> Decimal:
     """
@@ -23,16 +252,11 @@ def get_total_revenue(db: Session) -> Decimal:
         Total amount from invoices with status = PAID
     """
 
-    from app.utils.invoice_utils import calculate_invoice_totals
-
-    paid_invoices = db.query(Invoice).filter(
-        Invoice.status == InvoiceStatus.PAID
-    ).all()
+    total = db.query(func.sum(Invoice.vat_total))\
+        .filter(Invoice.status == InvoiceStatus.PAID)\
+        .scalar()
 
-    total = Decimal('0.00')
-    for invoice in paid_invoices:
-        totals = calculate_invoice_totals(invoice)
-        total += totals['vat_total']
+    total = _to_decimal(total)
 
     logger.info(f"Total revenue calculated: {total}")
     return total
@@ -45,32 +269,7 @@ def get_outstanding_amount(db: Session) -> Decimal:
     Includes: SENT, VIEWED, PARTIALLY_PAID, OVERDUE statuses
     """
 
-    from app.utils.invoice_utils import calculate_invoice_totals
-
-    unpaid_statuses = [
-        InvoiceStatus.SENT,
-        InvoiceStatus.VIEWED,
-        InvoiceStatus.PARTIALLY_PAID,
-        InvoiceStatus.OVERDUE
-    ]
-
-    unpaid_invoices = db.query(Invoice).filter(
-        Invoice.status.in_(unpaid_statuses)
-    ).all()
-
-    total_outstanding = Decimal('0.00')
-
-    for invoice in unpaid_invoices:
-        totals = calculate_invoice_totals(invoice)
-        invoice_total = totals['vat_total']
-
-        total_paid = sum(
-            p.amount_paid for p in invoice.payments
-            if p.status != PaymentStatus.CANCELLED
-        )
-
-        remaining = invoice_total - Decimal(str(total_paid))
-        total_outstanding += remaining
+    total_outstanding = _sum_remaining_balance(db, UNPAID_STATUSES)
 
     logger.info(f"Outstanding amount calculated: {total_outstanding}")
     return total_outstanding
@@ -83,25 +282,7 @@ def get_overdue_amount(db: Session) -> Decimal:
     Only counts invoices with OVERDUE status.
     """
 
-    from app.utils.invoice_utils import calculate_invoice_totals
-
-    overdue_invoices = db.query(Invoice).filter(
-        Invoice.status == InvoiceStatus.OVERDUE
-    ).all()
-
-    total_overdue = Decimal('0.00')
-
-    for invoice in overdue_invoices:
-        totals = calculate_invoice_totals(invoice)
-        invoice_total = totals['vat_total']
-
-        total_paid = sum(
-            p.amount_paid for p in invoice.payments
-            if p.status != PaymentStatus.CANCELLED
-        )
-
-        remaining = invoice_total - Decimal(str(total_paid))
-        total_overdue += remaining
+    total_overdue = _sum_remaining_balance(db, [InvoiceStatus.OVERDUE])
 
     logger.info(f"Overdue amount calculated: {total_overdue}")
     return total_overdue
@@ -115,28 +296,22 @@ def get_invoice_status_breakdown(db: Session) -> list[dict]:
         List of dicts with status, count, and total_amount
     """
 
-    from app.utils.invoice_utils import calculate_invoice_totals
-
-    invoices_by_status = db.query(Invoice).all()
-
-    status_map = {}
-
-    for invoice in invoices_by_status:
-        status = invoice.status.value
-
-        if status not in status_map:
-            status_map[status] = {
-                'status': status,
-                'count': 0,
-                'total_amount': Decimal('0.00')
-            }
-
-        status_map[status]['count'] += 1
-
-        totals = calculate_invoice_totals(invoice)
-        status_map[status]['total_amount'] += totals['vat_total']
-
-    result = list(status_map.values())
+    rows = db.query(
+        Invoice.status,
+        func.count(Invoice.id).label('count'),
+        func.sum(Invoice.vat_total).label('total_amount')
+    )\
+        .group_by(Invoice.status)\
+        .all()
+
+    result = [
+        {
+            'status': row.status.value,
+            'count': row.count,
+            'total_amount': _to_decimal(row.total_amount)
+        }
+        for row in rows
+    ]
     logger.info(f"Status breakdown calculated: {len(result)} statuses")
     return result
 
@@ -145,17 +320,25 @@ def get_entity_counts(db: Session) -> dict:
     """
     Get counts of key entities.
 
+    The invoice total comes from the status rollup, so it is not
+    counted again here.
+
     Returns:
-        Dict with total_invoices, total_clients, total_payments
+        Dict with total_clients, total_payments
     """
 
-    counts = {
-        'total_invoices': db.query(Invoice).count(),
-        'total_clients': db.query(Client).count(),
-        'total_payments': db.query(Payment).filter(
-            Payment.status != PaymentStatus.CANCELLED
-        ).count()
-    }
+    # Two scalar subqueries, one round-trip
+    row = db.execute(
+        select(
+            select(func.count(Client.id))
+            .scalar_subquery().label('total_clients'),
+            select(func.count(Payment.id))
+            .where(Payment.status != PaymentStatus.CANCELLED)
+            .scalar_subquery().label('total_payments')
+        )
+    ).one()
+
+    counts = dict(row._mapping)
 
     logger.info(f"Entity counts: {counts}")
     return counts
@@ -173,35 +356,35 @@ def get_monthly_revenue(db: Session, months: int = 12) -> list[dict]:
         List of dicts with month, revenue, invoice_count
     """
 
-    from app.utils.invoice_utils import calculate_invoice_totals
-
     current_date = get_current_timezone("Africa/Lagos")
     start_date = current_date - timedelta(days=months * 30)
 
-    invoices = db.query(Invoice).filter(
-        and_(
-            Invoice.status == InvoiceStatus.PAID,
-            Invoice.date_value >= start_date
-        )
-    ).order_by(Invoice.date_value.asc()).all()
-
-    monthly_data = {}
-
-    for invoice in invoices:
-        month_key = invoice.date_value.strftime('%Y-%m')
-
-        if month_key not in monthly_data:
-            monthly_data[month_key] = {
-                'month': month_key,
-                'revenue': Decimal('0.00'),
-                'invoice_count': 0
-            }
-
-        totals = calculate_invoice_totals(invoice)
-        monthly_data[month_key]['revenue'] += totals['vat_total']
-        monthly_data[month_key]['invoice_count'] += 1
-
-    result = sorted(monthly_data.values(), key=lambda x: x['month'])
+    month = _month_key(db, Invoice.date_value).label('month')
+
+    rows = db.query(
+        month,
+        func.sum(Invoice.vat_total).label('revenue'),
+        func.count(Invoice.id).label('invoice_count')
+    )\
+        .select_from(Invoice)\
+        .filter(
+            and_(
+                Invoice.status == InvoiceStatus.PAID,
+                Invoice.date_value >= start_date
+            )
+    )\
+        .group_by(month)\
+        .order_by(month)\
+        .all()
+
+    result = [
+        {
+            'month': row.month,
+            'revenue': _to_decimal(row.revenue),
+            'invoice_count': row.invoice_count
+        }
+        for row in rows
+    ]
 
     logger.info(f"Monthly revenue calculated for {len(result)} months")
     return result
@@ -220,40 +403,32 @@ def get_top_clients(db: Session, limit: int = 10) -> list[dict]:
         invoice_count, last_invoice_date
     """
 
-    from app.utils.invoice_utils import calculate_invoice_totals
-
-    invoices = db.query(Invoice).options(
-        joinedload(Invoice.client)
-    ).filter(
-        Invoice.status == InvoiceStatus.PAID
-    ).all()
-
-    client_map = {}
-
-    for invoice in invoices:
-        client_id = invoice.client_id
-
-        if client_id not in client_map:
-            client_map[client_id] = {
-                'client_id': client_id,
-                'client_name': invoice.client.name,
-                'total_revenue': Decimal('0.00'),
-                'invoice_count': 0,
-                'last_invoice_date': invoice.date_value
-            }
-
-        totals = calculate_invoice_totals(invoice)
-        client_map[client_id]['total_revenue'] += totals['vat_total']
-        client_map[client_id]['invoice_count'] += 1
-
-        if invoice.date_value > client_map[client_id]['last_invoice_date']:
-            client_map[client_id]['last_invoice_date'] = invoice.date_value
-
-    sorted_clients = sorted(
-        client_map.values(),
-        key=lambda x: x['total_revenue'],
-        reverse=True
-    )[:limit]
+    total_revenue = func.sum(Invoice.vat_total).label('total_revenue')
+
+    rows = db.query(
+        Client.id.label('client_id'),
+        Client.name.label('client_name'),
+        total_revenue,
+        func.count(Invoice.id).label('invoice_count'),
+        func.max(Invoice.date_value).label('last_invoice_date')
+    )\
+        .join(Invoice, Invoice.client_id == Client.id)\
+        .filter(Invoice.status == InvoiceStatus.PAID)\
+        .group_by(Client.id, Client.name)\
+        .order_by(total_revenue.desc())\
+        .limit(limit)\
+        .all()
+
+    sorted_clients = [
+        {
+            'client_id': row.client_id,
+            'client_name': row.client_name,
+            'total_revenue': _to_decimal(row.total_revenue),
+            'invoice_count': row.invoice_count,
+            'last_invoice_date': row.last_invoice_date
+        }
+        for row in rows
+    ]
 
     logger.info(f"Top {len(sorted_clients)} clients calculated")
     return sorted_clients
@@ -272,7 +447,8 @@ def get_recent_invoices(db: Session, limit: int = 5) -> list[Invoice]:
     """
 
     invoices = db.query(Invoice).options(
-        joinedload(Invoice.client)
+        selectinload(Invoice.client),
+        *_lazy_load_guard()
     ).order_by(
         Invoice.date_value.desc()
     ).limit(limit).all()
@@ -294,7 +470,8 @@ def get_recent_payments(db: Session, limit: int = 5) -> list[Payment]:
     """
 
     payments = db.query(Payment).options(
-        joinedload(Payment.invoice)
+        selectinload(Payment.invoice),
+        *_lazy_load_guard()
     ).filter(
         Payment.status != PaymentStatus.CANCELLED
     ).order_by(
@@ -305,15 +482,106 @@ def get_recent_payments(db: Session, limit: int = 5) -> list[Payment]:
     return payments
 
 
-def get_dashboard_stats(db: Session) -> dict:
+def _summarize_recent_invoices(db: Session, limit: int = 5) -> list[dict]:
+    """Recent invoices in RecentInvoiceSummary shape."""
+
+    recent_invoices = []
+    for invoice in get_recent_invoices(db, limit=limit):
+        recent_invoices.append({
+            'id': invoice.id,
+            'invoice_no': invoice.invoice_no,
+            'client_name': invoice.client.name,
+            'date_value': invoice.date_value,
+            'status': invoice.status.value,
+            'total_amount': invoice.vat_total
+        })
+
+    return recent_invoices
+
+
+def _summarize_recent_payments(db: Session, limit: int = 5) -> list[dict]:
+    """Recent payments in RecentPaymentSummary shape."""
+
+    recent_payments = []
+    for payment in get_recent_payments(db, limit=limit):
+        recent_payments.append({
+            'id': payment.id,
+            'client_name': payment.client_name,
+            'amount_paid': payment.amount_paid,
+            'payment_date': payment.payment_date,
+            'invoice_no': payment.invoice.invoice_no if payment.invoice else 'N/A'
+        })
+
+    return recent_payments
+
+
+# Independent dashboard queries; each only needs its own session
+_DASHBOARD_QUERIES: dict[str, Callable[[Session], Any]] = {
+    'status_rollup': _get_status_rollup,
+    'counts': get_entity_counts,
+    'monthly_revenue': lambda db: get_monthly_revenue(db, months=12),
+    'top_clients': lambda db: get_top_clients(db, limit=10),
+    'recent_invoices': _summarize_recent_invoices,
+    'recent_payments': _summarize_recent_payments,
+}
+
+
+# Shared across requests so concurrent dashboards cannot check out more
+# than this many extra pooled connections between them
+_DASHBOARD_EXECUTOR = ThreadPoolExecutor(
+    max_workers=3, thread_name_prefix='dashboard')
+
+
+def _run_in_session(session_factory: sessionmaker, query: Callable[[Session], Any]) -> Any:
+    """Run a dashboard query in its own short-lived session."""
+
+    with session_factory() as session:
+        return query(session)
+
+
+def _run_dashboard_queries(
+    db: Session,
+    session_factory: Optional[sessionmaker] = None
+) -> dict[str, Any]:
+    """
+    Run every dashboard query, in parallel when a session factory is given.
+
+    Sessions are not thread-safe, so each worker of the shared executor
+    opens its own session from session_factory. Without one, or on SQLite
+    (whose connections are bound to the creating thread), queries run
+    sequentially on db.
+    """
+
+    if session_factory is None or db.get_bind().dialect.name == 'sqlite':
+        return {name: query(db) for name, query in _DASHBOARD_QUERIES.items()}
+
+    futures = {
+        name: _DASHBOARD_EXECUTOR.submit(_run_in_session, session_factory, query)
+        for name, query in _DASHBOARD_QUERIES.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+
+def get_dashboard_stats(
+    db: Session,
+    session_factory: Optional[sessionmaker] = None,
+    user_id: Optional[int] = None
+) -> dict:
     """
     Orchestrate all analytics queries and return complete dashboard data.
 
     This is the main entry point for dashboard analytics. It calls all
     individual metric functions and aggregates results into a single response.
+    Results are cached for settings.DASHBOARD_CACHE_TTL seconds per user and
+    day; invoice, item, payment and client writes invalidate the cache when
+    they commit. The cache lives in this process, so in a multi-worker
+    deployment other workers may serve stats up to the TTL old.
 
     Args:
         db: Database session
+        session_factory: Optional sessionmaker; when given, the queries run
+            concurrently on separate pooled connections
+        user_id: ID of the requesting user, used as the cache key
 
     Returns:
         Dict containing all dashboard statistics ready for API response
@@ -322,82 +590,55 @@ def get_dashboard_stats(db: Session) -> dict:
         Exception: If any critical calculation fails
     """
     
+    cache_key = _dashboard_cache_key(user_id)
+    cached = _get_cached_dashboard(cache_key)
+    if cached is not None:
+        logger.debug("Dashboard stats served from cache")
+        return cached
+
+    generation = _dashboard_cache_generation
+
     logger.info("Starting dashboard stats calculation")
 
     try:
-        # Financial metrics (parallel-safe calculations)
-        total_revenue = get_total_revenue(db)
-        outstanding_amount = get_outstanding_amount(db)
-        overdue_amount = get_overdue_amount(db)
-
-        # Entity counts
-        counts = get_entity_counts(db)
-
-        # Status breakdown
-        status_breakdown = get_invoice_status_breakdown(db)
-
-        # Time series data
-        monthly_revenue = get_monthly_revenue(db, months=12)
-
-        # Top performers
-        top_clients = get_top_clients(db, limit=10)
-
-        # Recent activity
-        recent_invoices_raw = get_recent_invoices(db, limit=5)
-        recent_payments_raw = get_recent_payments(db, limit=5)
-
-        # Transform recent invoices to summary format
-        from app.utils.invoice_utils import calculate_invoice_totals
-
-        recent_invoices = []
-        for invoice in recent_invoices_raw:
-            totals = calculate_invoice_totals(invoice)
-            recent_invoices.append({
-                'id': invoice.id,
-                'invoice_no': invoice.invoice_no,
-                'client_name': invoice.client.name,
-                'date_value': invoice.date_value,
-                'status': invoice.status.value,
-                'total_amount': totals['vat_total']
-            })
-
-        # Transform recent payments to summary format
-        recent_payments = []
-        for payment in recent_payments_raw:
-            recent_payments.append({
-                'id': payment.id,
-                'client_name': payment.client_name,
-                'amount_paid': payment.amount_paid,
-                'payment_date': payment.payment_date,
-                'invoice_no': payment.invoice.invoice_no if payment.invoice else 'N/A'
-            })
+        results = _run_dashboard_queries(db, session_factory)
+        counts = results['counts']
+
+        # Financial metrics and status breakdown share one invoice scan
+        summary = _summarize_status_rollup(results['status_rollup'])
 
         # Aggregate all data
         dashboard_data = {
             # Financial metrics
-            'total_revenue': total_revenue,
-            'outstanding_amount': outstanding_amount,
-            'overdue_amount': overdue_amount,
+            'total_revenue': summary['total_revenue'],
+            'outstanding_amount': summary['outstanding_amount'],
+            'overdue_amount': summary['overdue_amount'],
 
             # Counts
-            'total_invoices': counts['total_invoices'],
+            'total_invoices': summary['total_invoices'],
             'total_clients': counts['total_clients'],
             'total_payments': counts['total_payments'],
 
             # Breakdowns
-            'invoice_status_breakdown': status_breakdown,
+            'invoice_status_breakdown': rows_to(
+                InvoiceStatusCount, summary['status_breakdown']),
 
             # Time series
-            'monthly_revenue': monthly_revenue,
+            'monthly_revenue': rows_to(
+                MonthlyRevenue, results['monthly_revenue']),
 
             # Top performers
-            'top_clients': top_clients,
+            'top_clients': rows_to(TopClient, results['top_clients']),
 
             # Recent activity
-            'recent_invoices': recent_invoices,
-            'recent_payments': recent_payments
+            'recent_invoices': rows_to(
+                RecentInvoiceSummary, results['recent_invoices']),
+            'recent_payments': rows_to(
+                RecentPaymentSummary, results['recent_payments'])
         }
 
+        _store_dashboard(cache_key, dashboard_data, generation)
+
         logger.info("Dashboard stats calculation completed successfully")
         return dashboard_data
 
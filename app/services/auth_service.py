@@ -1,5 +1,10 @@
+from collections import OrderedDict
+import hashlib
 import logging
+import threading
+import time
 from fastapi import Response
+from sqlalchemy import bindparam, exists, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
@@ -16,6 +21,51 @@ from ..core.security import (
 
 logger = logging.getLogger(__name__)
 
+# Column-only lookup for login; the full User is loaded only on success
+_LOGIN_STMT = select(User.id, User.password, User.is_active)\
+    .where(User.username == bindparam('username'))
+
+# Recently rejected credentials -> expiry, so floods of the same wrong
+# password skip the KDF. Only failures are cached, never successes. The TTL
+# is fixed and never extended, so insertion order is expiry order and the
+# oldest entry is evicted first once the cache is full.
+_FAILED_LOGIN_TTL = 5
+_FAILED_LOGIN_MAXSIZE = 10_000
+_failed_logins: OrderedDict[bytes, float] = OrderedDict()
+_failed_logins_lock = threading.Lock()
+
+
+def _failed_login_key(username: str, password: str, password_hash: str) -> bytes:
+    """Digest of the attempt; the stored hash makes a password change a miss."""
+    return hashlib.sha256(
+        "\0".join((username, password, password_hash)).encode()
+    ).digest()
+
+
+def _is_recent_failed_login(key: bytes) -> bool:
+    """Check whether this exact attempt was rejected within the TTL."""
+    with _failed_logins_lock:
+        expires_at = _failed_logins.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del _failed_logins[key]
+            return False
+        return True
+
+
+def _remember_failed_login(key: bytes) -> None:
+    """Record a rejected attempt, evicting expired then oldest entries."""
+    with _failed_logins_lock:
+        now = time.monotonic()
+        while _failed_logins:
+            oldest_key, expires_at = next(iter(_failed_logins.items()))
+            if expires_at > now and len(_failed_logins) < _FAILED_LOGIN_MAXSIZE:
+                break
+            del _failed_logins[oldest_key]
+        _failed_logins.pop(key, None)
+        _failed_logins[key] = now + _FAILED_LOGIN_TTL
+
 
 def issue_auth_tokens(user: User) -> tuple[str, str]:
     """Create a fresh access/refresh token pair for the user."""
@@ -51,16 +101,27 @@ def authenticate_user(username: str, password: str, db: Session) -> tuple[str, s
 
     logger.info(f"Authentication attempt for username: {username}")
 
-    user = db.query(User).filter(User.username == username).first()
+    row = db.execute(_LOGIN_STMT, {'username': username}).first()
 
-    if not user:
+    if not row:
         logger.warning(f"Authentication failed: User not found - {username}")
         raise UnauthorizedException(
             message="Invalid username or password",
             code="INVALID_CREDENTIALS"
         )
 
-    if not verify_password(password, user.password):
+    attempt_key = _failed_login_key(username, password, row.password)
+
+    # A cached rejection is answered as is; only a fresh KDF failure is
+    # recorded, so repeating the attempt does not extend its TTL
+    if _is_recent_failed_login(attempt_key):
+        password_ok = False
+    else:
+        password_ok = verify_password(password, row.password)
+        if not password_ok:
+            _remember_failed_login(attempt_key)
+
+    if not password_ok:
         logger.warning(
             f"Authentication failed: Invalid password for {username}")
         raise UnauthorizedException(
@@ -68,13 +129,20 @@ def authenticate_user(username: str, password: str, db: Session) -> tuple[str, s
             code="INVALID_CREDENTIALS"
         )
 
-    if not user.is_active:
+    if not row.is_active:
         logger.warning(f"Authentication failed: Inactive account - {username}")
         raise ForbiddenException(
             message="Account is inactive. Please contact support.",
             code="ACCOUNT_INACTIVE"
         )
 
+    user = db.get(User, row.id)
+    if not user:
+        raise UnauthorizedException(
+            message="Invalid username or password",
+            code="INVALID_CREDENTIALS"
+        )
+
     access_token, refresh_token = issue_auth_tokens(user)
 
     logger.info(f"Authentication successful for user: {username}")
@@ -86,8 +154,9 @@ def register_user(username: str, password: str, db: Session) -> User:
 
     logger.info(f"Registration attempt for username: {username}")
 
-    existing_user = db.query(User).filter(User.username == username).first()
-    if existing_user:
+    # Optimistic fast path; the unique constraint remains authoritative
+    username_taken = db.scalar(select(exists().where(User.username == username)))
+    if username_taken:
         logger.warning(
             f"Registration failed: Username already exists - {username}")
         raise ConflictException(
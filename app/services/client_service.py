@@ -1,10 +1,12 @@
 import logging
 from math import ceil
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import ConflictException, NotFoundException
 from app.models.client import Client
 from app.schemas.client import ClientCreate, ClientUpdate
+from app.services.analytics_service import invalidate_dashboard_cache_on_commit
 from app.services.database import transaction_scope
 
 logger = logging.getLogger(__name__)
@@ -26,14 +28,24 @@ def get_clients_paginated(
         )
 
     skip = (page-1)*limit
-    total = db.query(Client).count()
 
-    clients = db.query(Client)\
+    # COUNT(*) OVER () returns the total alongside the page in one query
+    rows = db.query(Client, func.count().over().label('total'))\
         .order_by(Client.id.desc())\
         .offset(skip)\
         .limit(limit)\
         .all()
 
+    clients = [row[0] for row in rows]
+
+    if rows:
+        total = rows[0][1]
+    elif skip > 0:
+        # Page past the end: no row carries the window total
+        total = db.query(Client).count()
+    else:
+        total = 0
+
     total_pages = ceil(total / limit) if total > 0 else 0
 
     return {
@@ -51,11 +63,12 @@ def create_client(client_data: ClientCreate, db: Session) -> Client:
     """Add a new client."""
 
     with transaction_scope(db):
-        existing_client = db.query(Client).filter(
-            Client.email == client_data.email
-        ).first()
+        # Optimistic fast path; the unique constraint remains authoritative
+        email_taken = db.scalar(
+            select(exists().where(Client.email == client_data.email))
+        )
 
-        if existing_client:
+        if email_taken:
             raise ConflictException(
                 message="Email already registered",
                 code="CLIENT_EMAIL_EXISTS"
@@ -64,6 +77,7 @@ def create_client(client_data: ClientCreate, db: Session) -> Client:
         new_client = Client(**client_data.model_dump())
         db.add(new_client)
         db.flush()
+        invalidate_dashboard_cache_on_commit(db)
 
         return new_client
 
@@ -100,6 +114,7 @@ def update_client(client_id: int, client_data: ClientUpdate, db: Session) -> Cli
             setattr(client, field, value)
 
         db.flush()
+        invalidate_dashboard_cache_on_commit(db)
 
         return client
 
@@ -117,3 +132,4 @@ def delete_client(client_id: int, db: Session) -> None:
             )
 
         db.delete(client)
+        invalidate_dashboard_cache_on_commit(db)
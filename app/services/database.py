@@ -3,6 +3,7 @@
 from contextlib import contextmanager
 from typing import Generator
 import logging
+import re
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import (
@@ -20,6 +21,23 @@ from app.core.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_CONSTRAINT_KIND_RE = re.compile(
+    r'already exists|foreign key|check constraint|not null', re.IGNORECASE)
+_CONSTRAINT_FIELD_RE = re.compile(
+    r'email|username|client_id|invoice_id', re.IGNORECASE)
+
+# (kind, field) -> message; (kind, None) is the fallback for each kind
+_CONSTRAINT_MESSAGES = {
+    ('already exists', 'email'): "Email address already registered",
+    ('already exists', 'username'): "Username already taken",
+    ('already exists', None): "Duplicate value for unique field",
+    ('foreign key', 'client_id'): "Referenced client does not exist",
+    ('foreign key', 'invoice_id'): "Referenced invoice does not exist",
+    ('foreign key', None): "Referenced record does not exist",
+    ('check constraint', None): "Data validation failed",
+    ('not null', None): "Required field is missing",
+}
+
 
 @contextmanager
 def transaction_scope(db: Session) -> Generator[Session, None, None]:
@@ -123,24 +141,13 @@ def _extract_constraint_name(error: IntegrityError) -> str:
 
     error_msg = str(error.orig) if hasattr(error, 'orig') else str(error)
 
-    if 'already exists' in error_msg.lower():
-        if 'email' in error_msg.lower():
-            return "Email address already registered"
-        elif 'username' in error_msg.lower():
-            return "Username already taken"
-        return "Duplicate value for unique field"
-
-    if 'foreign key' in error_msg.lower():
-        if 'client_id' in error_msg.lower():
-            return "Referenced client does not exist"
-        elif 'invoice_id' in error_msg.lower():
-            return "Referenced invoice does not exist"
-        return "Referenced record does not exist"
-
-    if 'check constraint' in error_msg.lower():
-        return "Data validation failed"
+    kind_match = _CONSTRAINT_KIND_RE.search(error_msg)
+    if not kind_match:
+        return "Database constraint violated"
 
-    if 'not null' in error_msg.lower():
-        return "Required field is missing"
+    kind = kind_match.group(0).lower()
+    field_match = _CONSTRAINT_FIELD_RE.search(error_msg)
+    field = field_match.group(0).lower() if field_match else None
 
-    return "Database constraint violated"
+    return _CONSTRAINT_MESSAGES.get(
+        (kind, field), _CONSTRAINT_MESSAGES[(kind, None)])
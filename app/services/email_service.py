@@ -1,30 +1,131 @@
 """Email service for sending emails via Resend."""
 
+import asyncio
 import base64
-from datetime import datetime
+from collections.abc import Iterable
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
 import logging
-import os
 from pathlib import Path
-import tempfile
 from typing import Any
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-import resend
-from sqlalchemy.orm import Session, joinedload
+import httpx
+from markupsafe import Markup
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    select_autoescape,
+)
+import requests
+from requests.adapters import HTTPAdapter
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, aliased, joinedload, selectinload
 from app.config.settings import settings
 from app.models.invoice import Invoice
-from app.models.payment import Payment
+from app.models.payment import Payment, PaymentStatus
 from app.services.pdf_service import generate_invoice_pdf
-from app.utils.invoice_utils import calculate_invoice_totals
+from app.utils.datetime_utils import MONTH_NAMES, get_current_timezone
+from app.utils.invoice_utils import (
+    CENT,
+    calculate_days_overdue,
+    calculate_invoice_totals,
+    is_invoice_overdue,
+)
 
 logger = logging.getLogger(__name__)
 
+_DEFAULT_FROM_FIELD = f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM_ADDRESS}>"
+
+RESEND_EMAILS_URL = "https://api.resend.com/emails"
+_RESEND_HEADERS = {"Authorization": f"Bearer {settings.RESEND_API_KEY}"}
+
+# Concurrent in-flight sends for bulk jobs, kept under Resend's rate cap
+BULK_SEND_CONCURRENCY = 14
+
+# Shared keep-alive session for synchronous sends; the Resend SDK opens a
+# new connection per call
+_http_session = requests.Session()
+_http_session.headers.update(_RESEND_HEADERS)
+_http_session.mount(
+    "https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
 template_dir = Path(__file__).parent.parent / 'templates' / 'email'
-jinja_env = Environment(
-    loader=FileSystemLoader(str(template_dir)),
-    autoescape=select_autoescape(['html', 'xml']),
-    trim_blocks=True,
-    lstrip_blocks=True
-)
+
+# Built on first render, so processes that never send email skip the
+# loader and bytecode-cache setup at import
+_jinja_env: Environment | None = None
+
+# Templates bound on first use, so later renders skip the loader lookup
+_templates: dict[str, Template] = {}
+
+
+def get_jinja_env() -> Environment:
+    """Return the email Jinja environment, creating it on first use."""
+
+    global _jinja_env
+
+    if _jinja_env is None:
+        # Compiled templates persist in a per-user temp directory across
+        # worker restarts, so cold workers skip the lex/parse/codegen step
+        env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            bytecode_cache=FileSystemBytecodeCache(),
+            autoescape=select_autoescape(['html', 'xml']),
+            trim_blocks=True,
+            lstrip_blocks=True,
+            auto_reload=False
+        )
+
+        # Process-wide template values, so per-send contexts only carry
+        # invoice/payment data
+        env.globals.update(
+            company_name=settings.EMAIL_FROM_NAME,
+            company_address='',  # Add to settings if needed
+        )
+
+        _jinja_env = env
+
+    return _jinja_env
+
+
+def _get_template(template_name: str) -> Template:
+    """Return a bound template, loading it on first use."""
+
+    template = _templates.get(template_name)
+    if template is None:
+        template = get_jinja_env().get_template(template_name)
+        _templates[template_name] = template
+    return template
+
+
+def _format_date(value: date) -> Markup:
+    """Format as 'January 05, 2026' (strftime('%B %d, %Y') without locale)."""
+
+    # Month names and digits only, so autoescape can skip it
+    return Markup(f"{MONTH_NAMES[value.month - 1]} {value.day:02d}, {value.year}")
+
+
+def _format_money(value: Decimal | int) -> Markup:
+    """Format an amount as '1,234.56' (same output as f"{value:,.2f}")."""
+
+    amount = Decimal(value).quantize(CENT)
+    sign = '-' if amount < 0 else ''
+    whole, cents = divmod(abs(int(amount * 100)), 100)
+    return Markup(f"{sign}{whole:,}.{cents:02d}")
+
+
+def _total_paid_for(invoice_id_column: Any) -> Any:
+    """Correlated scalar sum of non-cancelled payments for an invoice."""
+
+    paid = aliased(Payment)
+    return select(func.coalesce(func.sum(paid.amount_paid), 0))\
+        .where(
+            paid.invoice_id == invoice_id_column,
+            paid.status != PaymentStatus.CANCELLED
+        )\
+        .scalar_subquery()
 
 
 def render_email_template(template_name: str, context: dict) -> str:
@@ -42,8 +143,7 @@ def render_email_template(template_name: str, context: dict) -> str:
         EmailServiceError: If template rendering fails
     """
     try:
-        template = jinja_env.get_template(template_name)
-        return template.render(**context)
+        return _get_template(template_name).render(context)
     except Exception as e:
         logger.error(f"Template rendering failed: {str(e)}", exc_info=True)
         raise EmailServiceError(f"Failed to render email template: {str(e)}")
@@ -59,6 +159,46 @@ class EmailSendError(EmailServiceError):
     pass
 
 
+@lru_cache(maxsize=32)
+def _build_from_field(sender_name: str, sender: str) -> str:
+    """Format (and reuse) the 'Name <address>' from field for an override."""
+
+    return f"{sender_name} <{sender}>"
+
+
+def _build_email_params(
+    to: str,
+    subject: str,
+    html: str,
+    from_address: str | None = None,
+    from_name: str | None = None
+) -> dict[str, Any]:
+    """Build the Resend request payload for a single email."""
+
+    if from_address is None and from_name is None:
+        from_field = _DEFAULT_FROM_FIELD
+    else:
+        from_field = _build_from_field(
+            from_name or settings.EMAIL_FROM_NAME,
+            from_address or settings.EMAIL_FROM_ADDRESS
+        )
+
+    return {
+        "from": from_field,
+        "to": [to],
+        "subject": subject,
+        "html": html,
+    }
+
+
+def _post_email(params: dict[str, Any]) -> str:
+    """POST one email to the Resend API over the shared session."""
+
+    response = _http_session.post(RESEND_EMAILS_URL, json=params, timeout=10)
+    response.raise_for_status()
+    return response.json()["id"]
+
+
 def send_email(
     to: str,
     subject: str,
@@ -72,7 +212,6 @@ def send_email(
         to=to,
         subject=subject,
         html=html,
-        attachment_path=None,
         attachment_name=None,
         from_address=from_address,
         from_name=from_name
@@ -83,42 +222,26 @@ def send_email_with_attachment(
     to: str,
     subject: str,
     html: str,
-    attachment_path: str | None = None,
     attachment_name: str | None = None,
     from_address: str | None = None,
-    from_name: str | None = None
+    from_name: str | None = None,
+    attachment_bytes: bytes | None = None
 ) -> str:
-    """Send email with optional PDF attachment via Resend."""
-
-    resend.api_key = settings.RESEND_API_KEY
-
-    sender = from_address or settings.EMAIL_FROM_ADDRESS
-    sender_name = from_name or settings.EMAIL_FROM_NAME
-    from_field = f"{sender_name} <{sender}>"
+    """Send email with an optional in-memory PDF attachment via Resend."""
 
     try:
-        params: dict[str, Any] = {
-            "from": from_field,
-            "to": [to],
-            "subject": subject,
-            "html": html,
-        }
-
-        if attachment_path:
-            file_path = Path(attachment_path)
-            file_bytes = file_path.read_bytes()
-            filename = attachment_name or file_path.name
-            file_base64 = base64.b64encode(file_bytes).decode('utf-8')
+        params = _build_email_params(to, subject, html, from_address, from_name)
 
+        if attachment_bytes is not None:
             params["attachments"] = [
                 {
-                    "filename": filename,
-                    "content": file_base64
+                    "filename": attachment_name or "attachment.pdf",
+                    # base64 output is pure ASCII
+                    "content": base64.b64encode(attachment_bytes).decode('ascii')
                 }
             ]
 
-        response = resend.Emails.send(params)  # type: ignore
-        return response["id"]
+        return _post_email(params)
 
     except Exception as e:
         raise EmailSendError(f"Failed to send email to {to}: {str(e)}")
@@ -138,85 +261,67 @@ def send_invoice_email(invoice_id: int, db: Session) -> str:
     # Generate PDF
     pdf_bytes = generate_invoice_pdf(invoice_id, db)
 
-    # Save PDF to temporary file
-    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_pdf:
-        temp_pdf.write(pdf_bytes)
-        temp_pdf_path = temp_pdf.name
-
-    try:
-        # Calculate invoice totals
-        totals = calculate_invoice_totals(invoice)
-
-        # Prepare template context
-        context = {
-            'company_name': settings.EMAIL_FROM_NAME,
-            'company_address': '',  # Add to settings if needed
-            'current_year': datetime.now().year,
-            'client_name': invoice.client.name,
-            'invoice_no': invoice.invoice_no,
-            'invoice_date': invoice.date_value.strftime('%B %d, %Y'),
-            'due_date': invoice.invoice_due.strftime('%B %d, %Y'),
-            'total_amount': f"{totals['vat_total']:,.2f}",
-            'currency_symbol': '₦',  # Add to invoice model or settings
-        }
+    # Calculate invoice totals
+    totals = calculate_invoice_totals(invoice)
 
-        # Render email template (AFTER context is defined)
-        html = render_email_template('invoice_email.html', context)
+    # Prepare template context
+    context = {
+        'current_year': datetime.now().year,
+        'client_name': invoice.client.name,
+        'invoice_no': invoice.invoice_no or '',
+        'invoice_date': _format_date(invoice.date_value),
+        'due_date': _format_date(invoice.invoice_due),
+        'total_amount': _format_money(totals['vat_total']),
+        'currency_symbol': '₦',  # Add to invoice model or settings
+    }
 
-        # Email subject
-        subject = f"Invoice {invoice.invoice_no} from {settings.EMAIL_FROM_NAME}"
+    # Render email template (AFTER context is defined)
+    html = render_email_template('invoice_email.html', context)
 
-        # Send email with attachment
-        email_id = send_email_with_attachment(
-            to=invoice.client.email,
-            subject=subject,
-            html=html,
-            attachment_path=temp_pdf_path,
-            attachment_name=f"{invoice.invoice_no}.pdf"
-        )
+    # Email subject
+    subject = f"Invoice {invoice.invoice_no} from {settings.EMAIL_FROM_NAME}"
 
-        logger.info(
-            f"Invoice email sent using template",
-            extra={
-                'invoice_id': invoice_id,
-                'invoice_no': invoice.invoice_no,
-                'email_id': email_id
-            }
-        )
+    # Send email with attachment
+    email_id = send_email_with_attachment(
+        to=invoice.client.email,
+        subject=subject,
+        html=html,
+        attachment_bytes=pdf_bytes,
+        attachment_name=f"{invoice.invoice_no}.pdf"
+    )
 
-        return email_id
+    logger.info(
+        f"Invoice email sent using template",
+        extra={
+            'invoice_id': invoice_id,
+            'invoice_no': invoice.invoice_no,
+            'email_id': email_id
+        }
+    )
 
-    finally:
-        # Clean up temporary PDF file
-        if os.path.exists(temp_pdf_path):
-            os.remove(temp_pdf_path)
+    return email_id
 
 
 def send_payment_confirmation(payment_id: int, db: Session) -> str:
     """Send payment confirmation email to client using Jinja2 template."""
 
-    payment = db.query(Payment)\
+    # Total paid (non-cancelled payments) is summed in the same statement
+    row = db.query(Payment, _total_paid_for(Payment.invoice_id))\
         .options(
             joinedload(Payment.invoice).joinedload(Invoice.client),
-            joinedload(Payment.invoice).joinedload(Invoice.items),
-            joinedload(Payment.invoice).joinedload(Invoice.payments)
+            joinedload(Payment.invoice).selectinload(Invoice.items)
     )\
         .filter(Payment.id == payment_id)\
         .first()
 
-    if not payment:
+    if not row:
         raise EmailServiceError(f"Payment with id {payment_id} not found")
 
+    payment, total_paid = row
+
     # Calculate invoice totals
     totals = calculate_invoice_totals(payment.invoice)
 
-    # Calculate total paid (sum all non-cancelled payments)
-    from app.models.payment import PaymentStatus
-    total_paid = sum(
-        p.amount_paid for p in payment.invoice.payments
-        if p.status != PaymentStatus.CANCELLED
-    )
-
     # Calculate remaining balance
     remaining = totals['vat_total'] - total_paid
 
@@ -226,16 +331,15 @@ def send_payment_confirmation(payment_id: int, db: Session) -> str:
 
     # Prepare template context
     context = {
-        'company_name': settings.EMAIL_FROM_NAME,
         'current_year': datetime.now().year,
         'client_name': payment.invoice.client.name,
-        'amount_paid': f"{payment.amount_paid:,.2f}",
-        'payment_date': payment.payment_date.strftime('%B %d, %Y'),
+        'amount_paid': _format_money(payment.amount_paid),
+        'payment_date': _format_date(payment.payment_date),
         'payment_method': payment_method_display,
-        'invoice_number': payment.invoice.invoice_no,
-        'invoice_total': f"{totals['vat_total']:,.2f}",
-        'total_paid': f"{total_paid:,.2f}",
-        'remaining_balance': f"{remaining:,.2f}",
+        'invoice_number': payment.invoice.invoice_no or '',
+        'invoice_total': _format_money(totals['vat_total']),
+        'total_paid': _format_money(total_paid),
+        'remaining_balance': _format_money(remaining),
     }
 
     # Render email template
@@ -264,30 +368,34 @@ def send_payment_confirmation(payment_id: int, db: Session) -> str:
     return email_id
 
 
-def send_payment_reminder(invoice_id: int, db: Session) -> str:
-    """Send payment reminder email for overdue invoice using Jinja2 template."""
+def _prepare_payment_reminder(
+    invoice_id: int,
+    db: Session
+) -> tuple[dict[str, str], dict[str, Any]]:
+    """
+    Load an overdue invoice and render its reminder email.
 
-    from app.models.invoice import Invoice
-    from app.models.payment import PaymentStatus
-    from app.utils.datetime_utils import get_current_timezone
-    from app.utils.invoice_utils import (
-        calculate_invoice_totals,
-        calculate_days_overdue,
-        is_invoice_overdue
-    )
+    Returns:
+        Tuple of (message kwargs for send_email, log fields for the send)
 
-    invoice = db.query(Invoice)\
+    Raises:
+        EmailServiceError: If the invoice is missing or not overdue yet
+    """
+
+    # Total paid (non-cancelled payments) is summed in the same statement
+    row = db.query(Invoice, _total_paid_for(Invoice.id))\
         .options(
             joinedload(Invoice.client),
-            joinedload(Invoice.items),
-            joinedload(Invoice.payments)
+            selectinload(Invoice.items)
     )\
         .filter(Invoice.id == invoice_id)\
         .first()
 
-    if not invoice:
+    if not row:
         raise EmailServiceError(f"Invoice with id {invoice_id} not found")
 
+    invoice, total_paid = row
+
     # Get current time (timezone-aware)
     current_time = get_current_timezone("Africa/Lagos")
 
@@ -301,12 +409,6 @@ def send_payment_reminder(invoice_id: int, db: Session) -> str:
     # Calculate invoice totals
     totals = calculate_invoice_totals(invoice)
 
-    # Calculate total paid (sum all non-cancelled payments)
-    total_paid = sum(
-        p.amount_paid for p in invoice.payments
-        if p.status != PaymentStatus.CANCELLED
-    )
-
     # Calculate remaining balance
     remaining = totals['vat_total'] - total_paid
 
@@ -327,35 +429,129 @@ def send_payment_reminder(invoice_id: int, db: Session) -> str:
 
     # Prepare template context
     context = {
-        'company_name': settings.EMAIL_FROM_NAME,
         'current_year': datetime.now().year,
         'client_name': invoice.client.name,
-        'invoice_number': invoice.invoice_no,
-        'invoice_date': invoice.date_value.strftime('%B %d, %Y'),
-        'due_date': invoice.invoice_due.strftime('%B %d, %Y'),
+        'invoice_number': invoice.invoice_no or '',
+        'invoice_date': _format_date(invoice.date_value),
+        'due_date': _format_date(invoice.invoice_due),
         'days_overdue': days_overdue,
-        'amount_due': f"{remaining:,.2f}",
+        'amount_due': _format_money(remaining),
     }
 
     # Render email template
     html = render_email_template('payment_reminder.html', context)
 
+    message = {
+        'to': invoice.client.email,
+        'subject': subject,
+        'html': html
+    }
+    log_extra = {
+        'invoice_id': invoice_id,
+        'invoice_no': invoice.invoice_no,
+        'days_overdue': days_overdue,
+        'amount_due': float(remaining)
+    }
+
+    return message, log_extra
+
+
+def send_payment_reminder(invoice_id: int, db: Session) -> str:
+    """Send payment reminder email for overdue invoice using Jinja2 template."""
+
+    message, log_extra = _prepare_payment_reminder(invoice_id, db)
+
     # Send email
-    email_id = send_email(
-        to=invoice.client.email,
-        subject=subject,
-        html=html
-    )
+    email_id = send_email(**message)
 
     logger.info(
         "Payment reminder sent",
-        extra={
-            'invoice_id': invoice_id,
-            'invoice_no': invoice.invoice_no,
-            'email_id': email_id,
-            'days_overdue': days_overdue,
-            'amount_due': float(remaining)
-        }
+        extra={**log_extra, 'email_id': email_id}
     )
 
     return email_id
+
+
+async def send_email_async(params: dict[str, Any], client: httpx.AsyncClient) -> str:
+    """
+    Send one prepared email through the Resend HTTP API.
+
+    Posts directly with a shared client so bulk jobs reuse pooled
+    keep-alive connections instead of a new handshake per email.
+
+    Raises:
+        EmailSendError: If the request fails or Resend rejects it
+    """
+
+    try:
+        response = await client.post(RESEND_EMAILS_URL, json=params)
+        response.raise_for_status()
+        return response.json()["id"]
+
+    except Exception as e:
+        raise EmailSendError(
+            f"Failed to send email to {params['to'][0]}: {str(e)}")
+
+
+async def send_payment_reminders_bulk(
+    invoice_ids: Iterable[int],
+    db: Session
+) -> dict[int, str | EmailServiceError]:
+    """
+    Send payment reminders for many invoices concurrently.
+
+    Emails are rendered up front on db (sessions are not safe to share
+    across tasks), then sent over one pooled HTTP client with at most
+    BULK_SEND_CONCURRENCY requests in flight.
+
+    Args:
+        invoice_ids: IDs of overdue invoices to remind
+        db: Database session
+
+    Returns:
+        Dict of invoice_id -> email_id on success, or the EmailServiceError
+        that prevented the send
+    """
+
+    results: dict[int, str | EmailServiceError] = {}
+    prepared: dict[int, tuple[dict[str, str], dict[str, Any]]] = {}
+
+    for invoice_id in invoice_ids:
+        try:
+            prepared[invoice_id] = _prepare_payment_reminder(invoice_id, db)
+        except EmailServiceError as e:
+            results[invoice_id] = e
+
+    if not prepared:
+        return results
+
+    semaphore = asyncio.Semaphore(BULK_SEND_CONCURRENCY)
+
+    async with httpx.AsyncClient(
+        headers=_RESEND_HEADERS,
+        limits=httpx.Limits(max_keepalive_connections=BULK_SEND_CONCURRENCY),
+        timeout=30.0
+    ) as client:
+
+        async def send_one(message: dict[str, str]) -> str:
+            async with semaphore:
+                return await send_email_async(_build_email_params(**message), client)
+
+        outcomes = await asyncio.gather(
+            *(send_one(message) for message, _ in prepared.values()),
+            return_exceptions=True
+        )
+
+    for (invoice_id, (_, log_extra)), outcome in zip(prepared.items(), outcomes):
+        if isinstance(outcome, EmailServiceError):
+            results[invoice_id] = outcome
+        elif isinstance(outcome, BaseException):
+            results[invoice_id] = EmailSendError(str(outcome))
+        else:
+            results[invoice_id] = outcome
+            logger.info(
+                "Payment reminder sent",
+                extra={**log_extra, 'email_id': outcome}
+            )
+
+    return results
@@ -1,28 +1,53 @@
-from decimal import Decimal
 import logging
+from datetime import datetime
 from math import ceil
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from sqlalchemy import func, or_
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import bindparam, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, contains_eager, joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from app.core.celery_app import celery_app
 from app.core.exceptions import ConflictException, NotFoundException, ValidationException
 from app.models.client import Client
 from app.models.invoice import Invoice, InvoiceStatus
 from app.models.item import Item
+from app.models.payment import Payment
 from app.schemas.invoice import InvoiceCreate, InvoiceUpdate
+from app.services.analytics_service import invalidate_dashboard_cache_on_commit
 from app.services.database import transaction_scope
-from app.utils.datetime_utils import get_current_timezone
+from app.utils.datetime_utils import LAGOS_TZ, get_current_timezone
 from app.utils.invoice_utils import (
     InvoiceTotals,
     calculate_due_date,
     calculate_invoice_totals,
+    calculate_line_amount,
     generate_invoice_number,
-    track_invoice_view
+    refresh_invoice_total
 )
 
 logger = logging.getLogger(__name__)
 
+# Invoice list statements, built once; per-call work is only binding
+# parameters and applying limit/offset. COUNT(*) OVER () returns the total
+# alongside the page, and Invoice.client is populated from the Client join.
+_INVOICE_PAGE_STMT = select(Invoice, func.count().over().label('total'))\
+    .join(Client, Client.id == Invoice.client_id)\
+    .options(
+        contains_eager(Invoice.client),
+        selectinload(Invoice.items),
+        selectinload(Invoice.payments)
+)\
+    .order_by(Invoice.id.desc())
+_INVOICE_COUNT_STMT = select(func.count(Invoice.id))\
+    .join(Client, Client.id == Invoice.client_id)
+_INVOICE_SEARCH_CLAUSE = or_(
+    Client.name.ilike(bindparam('search')),
+    Client.email.ilike(bindparam('search'))
+)
+_INVOICE_CURSOR_CLAUSE = Invoice.id < bindparam('cursor')
 
 def get_status_value(status: InvoiceStatus) -> str:
     """Extract string value from status enum for logging/serialization."""
@@ -55,37 +80,38 @@ def _validate_invoice_exists(invoice_id: int, db: Session) -> Invoice:
     return invoice
 
 
-ALLOWED_STATUS_TRANSITIONS: dict[InvoiceStatus, set[InvoiceStatus]] = {
-    InvoiceStatus.DRAFT: {
+# Read-only view so the transition rules cannot be mutated at runtime
+ALLOWED_STATUS_TRANSITIONS: Mapping[InvoiceStatus, frozenset[InvoiceStatus]] = MappingProxyType({
+    InvoiceStatus.DRAFT: frozenset({
         InvoiceStatus.SENT,
         InvoiceStatus.CANCELLED
-    },
-    InvoiceStatus.SENT: {
+    }),
+    InvoiceStatus.SENT: frozenset({
         InvoiceStatus.VIEWED,
         InvoiceStatus.PAID,
         InvoiceStatus.PARTIALLY_PAID,
         InvoiceStatus.OVERDUE,
         InvoiceStatus.CANCELLED
-    },
-    InvoiceStatus.VIEWED: {
+    }),
+    InvoiceStatus.VIEWED: frozenset({
         InvoiceStatus.PAID,
         InvoiceStatus.PARTIALLY_PAID,
         InvoiceStatus.OVERDUE,
         InvoiceStatus.CANCELLED
-    },
-    InvoiceStatus.PAID: set(),
-    InvoiceStatus.PARTIALLY_PAID: {
+    }),
+    InvoiceStatus.PAID: frozenset(),
+    InvoiceStatus.PARTIALLY_PAID: frozenset({
         InvoiceStatus.PAID,
         InvoiceStatus.OVERDUE,
         InvoiceStatus.CANCELLED
-    },
-    InvoiceStatus.OVERDUE: {
+    }),
+    InvoiceStatus.OVERDUE: frozenset({
         InvoiceStatus.PAID,
         InvoiceStatus.PARTIALLY_PAID,
         InvoiceStatus.CANCELLED
-    },
-    InvoiceStatus.CANCELLED: set()
-}
+    }),
+    InvoiceStatus.CANCELLED: frozenset()
+})
 
 
 def validate_status_transition(
@@ -96,23 +122,27 @@ def validate_status_transition(
     if current_status == new_status:
         return
 
-    allowed_transitions = ALLOWED_STATUS_TRANSITIONS.get(current_status, set())
+    allowed_transitions = ALLOWED_STATUS_TRANSITIONS.get(current_status)
 
-    if new_status not in allowed_transitions:
-        allowed_list = (
-            [s.value for s in allowed_transitions]
-            if allowed_transitions
-            else ["none (terminal state)"]
-        )
-        raise ValidationException(
-            message=f"Invalid status transition from '{current_status.value}' to '{new_status.value}'",
-            details=[{
-                "field": "status",
-                "current": current_status.value,
-                "requested": new_status.value,
-                "allowed": ', '.join(allowed_list)
-            }]
-        )
+    if allowed_transitions is not None and new_status in allowed_transitions:
+        return
+
+    current_value = current_status.value
+    new_value = new_status.value
+    allowed_list = (
+        [s.value for s in allowed_transitions]
+        if allowed_transitions
+        else ["none (terminal state)"]
+    )
+    raise ValidationException(
+        message=f"Invalid status transition from '{current_value}' to '{new_value}'",
+        details=[{
+            "field": "status",
+            "current": current_value,
+            "requested": new_value,
+            "allowed": ', '.join(allowed_list)
+        }]
+    )
 
 
 def create_invoice(
@@ -124,38 +154,60 @@ def create_invoice(
 ) -> Invoice:
     """Create a new invoice with automation triggers."""
     with transaction_scope(db):
-        client = _validate_client_exists(invoice_data.client_id, db)
+        # PostgreSQL enforces invoice.client_id, so the INSERT doubles as the
+        # existence check; SQLite does not enforce foreign keys by default
+        client_checked_by_fk = db.get_bind().dialect.name == 'postgresql'
+        client = None
+        if not client_checked_by_fk:
+            client = _validate_client_exists(invoice_data.client_id, db)
 
         invoice_dict = invoice_data.model_dump(exclude={"items"})
         invoice = Invoice(**invoice_dict)
 
         if not invoice.invoice_due:
-            current_date = get_current_timezone("Africa/Lagos")
+            current_date = get_current_timezone(LAGOS_TZ)
             invoice.invoice_due = calculate_due_date(
                 current_date, payment_terms_days
             )
 
         db.add(invoice)
-        db.flush()
+        try:
+            db.flush()
+        except IntegrityError as e:
+            if not client_checked_by_fk or 'client_id' not in str(e.orig):
+                raise
+            raise NotFoundException(
+                message=f"Client with id {invoice_data.client_id} not found",
+                resource="client"
+            ) from e
 
         invoice.invoice_no = generate_invoice_number(invoice.id)
         invoice.purchase_no = invoice.id
 
+        item_rows = []
         for item_data in invoice_data.items:
-            qty = Decimal(str(item_data.qty))
-            rate = Decimal(str(item_data.rate))
-            amount = (qty * rate).quantize(Decimal('0.01'))
-
-            item = Item(
-                item_desc=item_data.item_desc,
-                qty=qty,
-                rate=rate,
-                amount=amount,
-                invoice_id=invoice.id
-            )
-            db.add(item)
-
-        db.flush()
+            item_rows.append({
+                "item_desc": item_data.item_desc,
+                "qty": item_data.qty,
+                "rate": item_data.rate,
+                "amount": calculate_line_amount(item_data.qty, item_data.rate),
+                "invoice_id": invoice.id
+            })
+
+        # One executemany INSERT instead of a unit-of-work insert per item
+        if item_rows:
+            db.execute(insert(Item), item_rows)
+
+        db.expire(invoice, ['items'])
+        refresh_invoice_total(invoice)
+        invalidate_dashboard_cache_on_commit(db)
+
+        # Log consumers key on client_name; only the FK path lacks the row
+        if client is not None:
+            client_name = client.name
+        else:
+            client_name = db.scalar(
+                select(Client.name).where(Client.id == invoice.client_id))
 
         logger.info(
             f"Invoice {invoice.id} created with {len(invoice_data.items)} items",
@@ -163,15 +215,13 @@ def create_invoice(
                 "invoice_id": invoice.id,
                 "invoice_no": invoice.invoice_no,
                 "client_id": invoice.client_id,
-                "client_name": client.name,
+                "client_name": client_name,
                 "item_count": len(invoice_data.items),
                 "due_date": invoice.invoice_due.isoformat()
             }
         )
 
         if auto_generate_pdf and auto_send_email:
-            from app.core.celery_app import celery_app
-
             celery_app.send_task(
                 'invoice.generate_and_send',
                 args=[invoice.id]
@@ -182,8 +232,6 @@ def create_invoice(
             )
         elif auto_send_email:
             # Email only
-            from app.core.celery_app import celery_app
-
             celery_app.send_task(
                 'email.send_invoice',
                 args=[invoice.id]
@@ -215,7 +263,9 @@ def update_invoice(
         for field, value in update_data.items():
             setattr(invoice, field, value)
 
+        refresh_invoice_total(invoice)
         db.flush()
+        invalidate_dashboard_cache_on_commit(db)
 
         logger.info(
             f"Invoice {invoice_id} updated",
@@ -241,6 +291,7 @@ def change_invoice_status(
 
         invoice.status = new_status
         db.flush()
+        invalidate_dashboard_cache_on_commit(db)
 
         logger.info(
             f"Invoice {invoice_id} status changed",
@@ -261,10 +312,7 @@ def delete_invoice(
 ) -> None:
     """Delete an invoice and all related data (items, payments)."""
     with transaction_scope(db):
-        invoice = db.query(Invoice)\
-            .options(selectinload(Invoice.payments))\
-            .filter(Invoice.id == invoice_id)\
-            .first()
+        invoice = db.query(Invoice).filter(Invoice.id == invoice_id).first()
 
         if not invoice:
             raise NotFoundException(
@@ -272,23 +320,54 @@ def delete_invoice(
                 resource="invoice"
             )
 
-        if not allow_with_payments and invoice.payments:
+        # Count in SQL rather than hydrating every payment row
+        payment_count = db.scalar(
+            select(func.count(Payment.id))
+            .where(Payment.invoice_id == invoice_id)
+        )
+
+        if not allow_with_payments and payment_count:
             raise ConflictException(
-                message=f"Cannot delete invoice {invoice_id} because it has {len(invoice.payments)} payment(s)",
+                message=f"Cannot delete invoice {invoice_id} because it has {payment_count} payment(s)",
                 code="INVOICE_HAS_PAYMENTS"
             )
 
         db.delete(invoice)
+        invalidate_dashboard_cache_on_commit(db)
 
         logger.info(
             f"Invoice {invoice_id} deleted",
             extra={
                 "invoice_id": invoice_id,
-                "had_payments": len(invoice.payments) > 0
+                "had_payments": payment_count > 0
             }
         )
 
 
+def _record_invoice_view(invoice: Invoice, db: Session) -> None:
+    """
+    Bump view tracking with one atomic UPDATE ... RETURNING.
+
+    The increment happens in SQL, so concurrent views are not lost to a
+    read-modify-write race; the returned values are copied onto the loaded
+    instance without marking it dirty.
+    """
+
+    stmt = update(Invoice)\
+        .where(Invoice.id == invoice.id)\
+        .values(
+            view_count=func.coalesce(Invoice.view_count, 0) + 1,
+            last_view=datetime.now()
+        )\
+        .returning(Invoice.view_count, Invoice.last_view)\
+        .execution_options(synchronize_session=False)
+
+    view_count, last_view = db.execute(stmt).one()
+
+    set_committed_value(invoice, 'view_count', view_count)
+    set_committed_value(invoice, 'last_view', last_view)
+
+
 def get_invoice_by_id(
     invoice_id: int,
     db: Session,
@@ -298,10 +377,13 @@ def get_invoice_by_id(
     """Get a single invoice by ID with optional view tracking."""
     query = db.query(Invoice)
 
+    # Client and items join into the invoice SELECT; payments, read by the
+    # balance and status code, come in one more query rather than a
+    # lazy load per access (joining both collections would multiply rows)
     if load_relationships:
         query = query.options(
             joinedload(Invoice.client),
-            selectinload(Invoice.items),
+            joinedload(Invoice.items),
             selectinload(Invoice.payments)
         )
 
@@ -315,7 +397,7 @@ def get_invoice_by_id(
 
     if track_view:
         with transaction_scope(db):
-            track_invoice_view(invoice)
+            _record_invoice_view(invoice, db)
 
     totals = calculate_invoice_totals(invoice)
 
@@ -326,42 +408,73 @@ def get_invoices_paginated(
     db: Session,
     page: int = 1,
     limit: int = 10,
-    search: Optional[str] = None
+    search: Optional[str] = None,
+    cursor: Optional[int] = None
 ) -> dict:
-    """Get paginated list of invoices with optional search."""
+    """
+    Get paginated list of invoices with optional search.
+
+    With cursor (the last invoice id of the previous page) the page is
+    found by keyset on Invoice.id instead of OFFSET, so deep pages cost the
+    same as the first. total and total_pages still cover every matching
+    invoice, and page is derived from the cursor's position rather than
+    taken from the argument. pagination.next_cursor is set while more pages
+    remain.
+    """
     if limit < 1 or limit > 100:
         raise ValidationException(
             message="Pagination limit must be between 1 and 100",
             details=[{"field": "limit", "range": "1-100"}]
         )
 
-    query = db.query(Invoice)\
-        .join(Client, Client.id == Invoice.client_id)\
-        .options(
-            joinedload(Invoice.client),
-            selectinload(Invoice.items),
-            selectinload(Invoice.payments)
-    )
+    page_stmt = _INVOICE_PAGE_STMT
+    count_stmt = _INVOICE_COUNT_STMT
+    params = {}
 
     if search:
-        search_term = f"%{search}%"
-        query = query.filter(
-            or_(
-                func.lower(Client.name).like(func.lower(search_term)),
-                func.lower(Client.email).like(func.lower(search_term))
-            )
-        )
+        page_stmt = page_stmt.where(_INVOICE_SEARCH_CLAUSE)
+        count_stmt = count_stmt.where(_INVOICE_SEARCH_CLAUSE)
+        params["search"] = f"%{search}%"
 
-    total = query.count()
+    page_params = params
 
-    skip = (page - 1) * limit
-    invoices = query\
-        .order_by(Invoice.id.desc())\
-        .offset(skip)\
-        .limit(limit)\
-        .all()
+    if cursor is not None:
+        if cursor < 1:
+            raise ValidationException(
+                message="Pagination cursor must be a positive invoice id",
+                details=[{"field": "cursor", "value": cursor}]
+            )
+        page_stmt = page_stmt.where(_INVOICE_CURSOR_CLAUSE)
+        page_params = {**params, "cursor": cursor}
+        skip = 0
+    else:
+        skip = (page - 1) * limit
+
+    rows = db.execute(
+        page_stmt.offset(skip).limit(limit),
+        page_params
+    ).all()
+
+    invoices = [row[0] for row in rows]
+
+    if cursor is not None:
+        # The window total only counts from the cursor onward
+        remaining = rows[0][1] if rows else 0
+        total = db.execute(count_stmt, params).scalar_one()
+        page = (total - remaining) // limit + 1
+    else:
+        if rows:
+            total = rows[0][1]
+        elif skip > 0:
+            # Page past the end: no row carries the window total
+            total = db.execute(count_stmt, params).scalar_one()
+        else:
+            total = 0
+        remaining = total - skip
 
     total_pages = ceil(total / limit) if total > 0 else 0
+    next_cursor = invoices[-1].id \
+        if invoices and len(invoices) < remaining else None
 
     return {
         "invoices": invoices,
@@ -369,6 +482,7 @@ def get_invoices_paginated(
             "page": page,
             "limit": limit,
             "total": total,
-            "total_pages": total_pages
+            "total_pages": total_pages,
+            "next_cursor": next_cursor
         }
     }
@@ -1,11 +1,12 @@
-from decimal import ROUND_HALF_UP, Decimal
 import logging
 from sqlalchemy.orm import Session
 from app.core.exceptions import ConflictException, NotFoundException
 from app.models.invoice import Invoice
 from app.models.item import Item
 from app.schemas.item import ItemCreate, ItemUpdate
+from app.services.analytics_service import invalidate_dashboard_cache_on_commit
 from app.services.database import transaction_scope
+from app.utils.invoice_utils import calculate_line_amount, refresh_invoice_total
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +26,7 @@ def add_item_to_invoice(
                 resource="invoice"
             )
 
-        qty = Decimal(str(item_data.qty))
-        rate = Decimal(str(item_data.rate))
-        amount = (qty * rate).quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        amount = calculate_line_amount(item_data.qty, item_data.rate)
 
         item = Item(
             item_desc=item_data.item_desc,
@@ -40,6 +39,10 @@ def add_item_to_invoice(
         db.add(item)
         db.flush()
 
+        db.expire(invoice, ['items'])
+        refresh_invoice_total(invoice)
+        invalidate_dashboard_cache_on_commit(db)
+
         return item
 
 
@@ -64,14 +67,11 @@ def update_item(
             setattr(item, field, value)
 
         if 'qty' in update_data or 'rate' in update_data:
-            qty = Decimal(str(item.qty))
-            rate = Decimal(str(item.rate))
-            item.amount = (qty * rate).quantize(
-                Decimal('0.01'),
-                rounding=ROUND_HALF_UP
-            )
+            item.amount = calculate_line_amount(item.qty, item.rate)
 
         db.flush()
+        refresh_invoice_total(item.invoice)
+        invalidate_dashboard_cache_on_commit(db)
 
         return item
 
@@ -92,33 +92,47 @@ def delete_item(
             )
 
         if not allow_last_item_delete:
-            item_count = db.query(Item)\
-                .filter(Item.invoice_id == item.invoice_id)\
-                .count()
-
-            if item_count == 1:
+            # Probe for one other item instead of counting all of them
+            has_other_items = db.query(
+                db.query(Item.id)
+                .filter(Item.invoice_id == item.invoice_id, Item.id != item.id)
+                .exists()
+            ).scalar()
+
+            if not has_other_items:
                 raise ConflictException(
                     message=f"Cannot delete the last item from invoice {item.invoice_id}. "
                     "Invoices must have at least one line item.",
                     code="LAST_ITEM_DELETION_FORBIDDEN"
                 )
 
+        invoice = item.invoice
+
         db.delete(item)
+        db.flush()
+
+        db.expire(invoice, ['items'])
+        refresh_invoice_total(invoice)
+        invalidate_dashboard_cache_on_commit(db)
 
 
 def get_invoice_items(invoice_id: int, db: Session) -> list[Item]:
     """Get all items for a specific invoice."""
 
-    invoice = db.query(Invoice).filter(Invoice.id == invoice_id).first()
-    if not invoice:
-        raise NotFoundException(
-            message=f"Invoice with id {invoice_id} not found",
-            resource="invoice"
-        )
-
     items = db.query(Item)\
         .filter(Item.invoice_id == invoice_id)\
         .order_by(Item.id.asc())\
         .all()
 
+    # Items imply the invoice exists; only an empty result needs the probe
+    if not items:
+        invoice_exists = db.query(Invoice.id)\
+            .filter(Invoice.id == invoice_id)\
+            .scalar()
+        if invoice_exists is None:
+            raise NotFoundException(
+                message=f"Invoice with id {invoice_id} not found",
+                resource="invoice"
+            )
+
     return items
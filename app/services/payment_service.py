@@ -3,17 +3,26 @@ import logging
 from math import ceil
 from typing import Optional
 
-from sqlalchemy.orm import joinedload, Session
+from sqlalchemy import exists, func, select, tuple_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload, raiseload, selectinload, Session
 
 from app.core.exceptions import ConflictException, NotFoundException
 from app.models.invoice import Invoice, InvoiceStatus
 from app.models.payment import InvoicePaymentState, Payment, PaymentStatus
 from app.schemas.payment import PaymentCreate, PaymentUpdate
+from app.services.analytics_service import invalidate_dashboard_cache_on_commit
 from app.services.database import transaction_scope
-from app.utils.invoice_utils import calculate_invoice_totals
+from app.utils.invoice_utils import ZERO, calculate_invoice_totals
 
 logger = logging.getLogger(__name__)
 
+_PAYMENT_STATE_TO_INVOICE_STATUS = {
+    InvoicePaymentState.FULLY_PAID: InvoiceStatus.PAID,
+    InvoicePaymentState.OVERPAID: InvoiceStatus.PAID,
+    InvoicePaymentState.PARTIALLY_PAID: InvoiceStatus.PARTIALLY_PAID,
+}
+
 
 """
 TODO: After successful creation, enqueue background job to:
@@ -29,28 +38,37 @@ def get_status_value(status: InvoiceStatus | PaymentStatus | InvoicePaymentState
     return status.value
 
 
-def calculate_remaining_balance(invoice: Invoice) -> Decimal:
-    """Calculate the remaining balance owed on an invoice."""
-
-    totals = calculate_invoice_totals(invoice)
-    invoice_total = totals["vat_total"]
+def _compute_balance(invoice: Invoice, invoice_total: Decimal) -> Decimal:
+    """Remaining balance given an already computed invoice total."""
 
+    # Enum members are singletons; bind once and compare by identity
+    cancelled = PaymentStatus.CANCELLED
+    # Start from a Decimal so the sum stays Decimal even with no payments
     total_paid = sum(
-        payment.amount_paid
-        for payment in invoice.payments
-        if payment.status != PaymentStatus.CANCELLED
+        (
+            payment.amount_paid
+            for payment in invoice.payments
+            if payment.status is not cancelled
+        ),
+        ZERO
     )
 
-    remaining = invoice_total - Decimal(str(total_paid))
-    return remaining
+    return invoice_total - total_paid
+
+
+def calculate_remaining_balance(invoice: Invoice) -> Decimal:
+    """Calculate the remaining balance owed on an invoice."""
+
+    totals = calculate_invoice_totals(invoice)
+    return _compute_balance(invoice, totals["vat_total"])
 
 
 def determine_payment_status(invoice: Invoice) -> InvoicePaymentState:
     """Determine invoice payment state based on payments received."""
 
-    remaining_balance = calculate_remaining_balance(invoice)
     totals = calculate_invoice_totals(invoice)
     invoice_total = totals["vat_total"]
+    remaining_balance = _compute_balance(invoice, invoice_total)
 
     if remaining_balance == 0:
         return InvoicePaymentState.FULLY_PAID
@@ -62,10 +80,29 @@ def determine_payment_status(invoice: Invoice) -> InvoicePaymentState:
         return InvoicePaymentState.UNPAID
 
 
-def _validate_invoice_exists(invoice_id: int, db: Session) -> Invoice:
-    """Validate invoice exists and return it."""
+def _validate_invoice_exists(
+    invoice_id: int,
+    db: Session,
+    load_payments: bool = False
+) -> Invoice:
+    """
+    Validate invoice exists and return it.
+
+    With load_payments the items and payments needed for the status
+    recalculation come in up front, and any other relationship raises
+    instead of lazy loading behind the caller's back.
+    """
+
+    query = db.query(Invoice)
+
+    if load_payments:
+        query = query.options(
+            selectinload(Invoice.items),
+            selectinload(Invoice.payments),
+            raiseload('*')
+        )
 
-    invoice = db.query(Invoice).filter(Invoice.id == invoice_id).first()
+    invoice = query.filter(Invoice.id == invoice_id).first()
 
     if not invoice:
         raise NotFoundException(
@@ -76,37 +113,43 @@ def _validate_invoice_exists(invoice_id: int, db: Session) -> Invoice:
     return invoice
 
 
-def _validate_payment_reference_unique(
-    invoice_id: int,
-    reference_number: Optional[str],
-    db: Session
-) -> None:
-    """Validate payment reference number is unique for this invoice."""
-
-    if not reference_number:
-        return
+def _validate_invoice_id_exists(invoice_id: int, db: Session) -> None:
+    """Validate invoice exists without loading it."""
 
-    existing_payment = db.query(Payment).filter(
-        Payment.invoice_id == invoice_id,
-        Payment.reference_number == reference_number
-    ).first()
+    invoice_exists = db.scalar(select(exists().where(Invoice.id == invoice_id)))
 
-    if existing_payment:
-        raise ConflictException(
-            message=f"Payment with reference '{reference_number}' "
-            f"already exists for invoice {invoice_id}",
-            code="DUPLICATE_PAYMENT_REFERENCE"
+    if not invoice_exists:
+        raise NotFoundException(
+            message=f"Invoice with id {invoice_id} not found",
+            resource="invoice"
         )
 
 
 def _create_payment_record(payment_data: PaymentCreate, db: Session) -> Payment:
-    """Create and persist payment record (no commit)."""
+    """
+    Create and persist payment record (no commit).
+
+    The unique (invoice_id, reference_number) index rejects a duplicate
+    reference, so no existence query runs before the INSERT.
+    """
 
     payment_dict = payment_data.model_dump()
     payment = Payment(**payment_dict)
 
     db.add(payment)
-    db.flush()
+    try:
+        db.flush()
+    except IntegrityError as e:
+        # SQLite names the columns, PostgreSQL names the index
+        error_msg = str(e.orig)
+        if 'reference_number' not in error_msg \
+                and 'payment_invoice_reference_uidx' not in error_msg:
+            raise
+        raise ConflictException(
+            message=f"Payment with reference '{payment_data.reference_number}' "
+            f"already exists for invoice {payment_data.invoice_id}",
+            code="DUPLICATE_PAYMENT_REFERENCE"
+        ) from e
 
     return payment
 
@@ -116,12 +159,9 @@ def _update_invoice_status_after_payment(invoice: Invoice, db: Session) -> None:
 
     payment_status = determine_payment_status(invoice)
 
-    if payment_status == InvoicePaymentState.FULLY_PAID:
-        invoice.status = InvoiceStatus.PAID
-    elif payment_status == InvoicePaymentState.OVERPAID:
-        invoice.status = InvoiceStatus.PAID
-    elif payment_status == InvoicePaymentState.PARTIALLY_PAID:
-        invoice.status = InvoiceStatus.PARTIALLY_PAID
+    # UNPAID leaves the current status alone
+    invoice.status = _PAYMENT_STATE_TO_INVOICE_STATUS.get(
+        payment_status, invoice.status)
 
 
 def get_payment_by_id(
@@ -161,20 +201,71 @@ def get_payments_for_invoice(invoice_id: int, db: Session) -> list[Payment]:
 def get_payments_paginated(
     db: Session,
     page: int = 1,
-    limit: int = 10
+    limit: int = 10,
+    cursor: Optional[int] = None
 ) -> dict:
-    """Retrieve all payments with pagination."""
+    """
+    Retrieve all payments with pagination, newest first.
+
+    With cursor (the last payment id of the previous page) the page is
+    found by keyset on (date_created, id) instead of OFFSET, the same way
+    as invoice pagination. total and total_pages still cover every payment,
+    and page is derived from the cursor's position. An unknown cursor
+    raises NotFoundException. pagination.next_cursor is set while more
+    pages remain.
+    """
 
     if limit < 1 or limit > 100:
         raise ValueError("Limit can only be between 1 and 100")
 
-    query = db.query(Payment).order_by(Payment.date_created.desc())
-    total = query.count()
+    query = db.query(Payment)
+
+    if cursor is not None:
+        cursor_created = db.scalar(
+            select(Payment.date_created).where(Payment.id == cursor)
+        )
+        if cursor_created is None:
+            raise NotFoundException(
+                message=f"Pagination cursor {cursor} does not match a payment",
+                resource="payment"
+            )
+        page_query = query.filter(
+            tuple_(Payment.date_created, Payment.id)
+            < tuple_(cursor_created, cursor)
+        )
+        skip = 0
+    else:
+        page_query = query
+        skip = (page - 1) * limit
+
+    # COUNT(*) OVER () returns the matching total alongside the page
+    rows = page_query\
+        .add_columns(func.count().over().label('total'))\
+        .order_by(Payment.date_created.desc(), Payment.id.desc())\
+        .offset(skip)\
+        .limit(limit)\
+        .all()
+
+    payments = [row[0] for row in rows]
 
-    skip = (page - 1) * limit
-    payments = query.offset(skip).limit(limit).all()
+    if cursor is not None:
+        # The window total only counts from the cursor onward
+        remaining = rows[0][1] if rows else 0
+        total = query.count()
+        page = (total - remaining) // limit + 1
+    else:
+        if rows:
+            total = rows[0][1]
+        elif skip > 0:
+            # Page past the end: no row carries the window total
+            total = query.count()
+        else:
+            total = 0
+        remaining = total - skip
 
     total_pages = ceil(total / limit) if total > 0 else 0
+    next_cursor = payments[-1].id \
+        if payments and len(payments) < remaining else None
 
     return {
         "payments": payments,
@@ -182,7 +273,8 @@ def get_payments_paginated(
             "page": page,
             "limit": limit,
             "total": total,
-            "total_pages": total_pages
+            "total_pages": total_pages,
+            "next_cursor": next_cursor
         }
     }
 
@@ -191,14 +283,9 @@ def create_payment(payment_data: PaymentCreate, db: Session) -> Payment:
     """Create a new payment record for an invoice."""
 
     with transaction_scope(db):
-        _validate_invoice_exists(payment_data.invoice_id, db)
-        _validate_payment_reference_unique(
-            payment_data.invoice_id,
-            payment_data.reference_number,
-            db
-        )
-
+        _validate_invoice_id_exists(payment_data.invoice_id, db)
         payment = _create_payment_record(payment_data, db)
+        invalidate_dashboard_cache_on_commit(db)
         return payment
 
 
@@ -209,15 +296,13 @@ def create_payment_and_update_invoice(
     """Atomically create a payment and update the invoice status."""
 
     with transaction_scope(db):
-        invoice = _validate_invoice_exists(payment_data.invoice_id, db)
-        _validate_payment_reference_unique(
-            payment_data.invoice_id,
-            payment_data.reference_number,
-            db
-        )
-
+        invoice = _validate_invoice_exists(
+            payment_data.invoice_id, db, load_payments=True)
         payment = _create_payment_record(payment_data, db)
+        # payments was loaded before the insert; add the new row in memory
+        invoice.payments.append(payment)
         _update_invoice_status_after_payment(invoice, db)
+        invalidate_dashboard_cache_on_commit(db)
 
         logger.info(
             f"Payment {payment.id} created and invoice {invoice.id} "
@@ -256,8 +341,19 @@ def update_payment(
 ) -> Payment:
     """Update an existing payment (partial update)."""
 
+    update_data = payment_data.model_dump(exclude_unset=True)
+
     with transaction_scope(db):
-        payment = db.query(Payment).filter(Payment.id == payment_id).first()
+        if update_data:
+            # One UPDATE ... RETURNING instead of SELECT, then flush
+            payment = db.execute(
+                update(Payment)
+                .where(Payment.id == payment_id)
+                .values(**update_data)
+                .returning(Payment)
+            ).scalar_one_or_none()
+        else:
+            payment = db.get(Payment, payment_id)
 
         if not payment:
             raise NotFoundException(
@@ -265,12 +361,7 @@ def update_payment(
                 resource="payment"
             )
 
-        update_data = payment_data.model_dump(exclude_unset=True)
-
-        for field, value in update_data.items():
-            setattr(payment, field, value)
-
-        db.flush()
+        invalidate_dashboard_cache_on_commit(db)
         return payment
 
 
@@ -287,13 +378,21 @@ def delete_payment(payment_id: int, db: Session) -> None:
             )
 
         db.delete(payment)
+        invalidate_dashboard_cache_on_commit(db)
 
 
 def delete_payment_and_update_invoice(payment_id: int, db: Session) -> int:
     """Atomically delete a payment and update the invoice status."""
 
     with transaction_scope(db):
-        payment = db.query(Payment).filter(Payment.id == payment_id).first()
+        # Payment, its invoice and the collections the status check reads
+        payment = db.query(Payment)\
+            .options(
+                joinedload(Payment.invoice).selectinload(Invoice.items),
+                joinedload(Payment.invoice).selectinload(Invoice.payments)
+        )\
+            .filter(Payment.id == payment_id)\
+            .first()
 
         if not payment:
             raise NotFoundException(
@@ -304,10 +403,13 @@ def delete_payment_and_update_invoice(payment_id: int, db: Session) -> int:
         invoice = payment.invoice
         invoice_id = payment.invoice_id
 
+        # The loaded collection would otherwise still hold the deleted row
+        invoice.payments.remove(payment)
         db.delete(payment)
         db.flush()
 
         _update_invoice_status_after_payment(invoice, db)
+        invalidate_dashboard_cache_on_commit(db)
 
         logger.info(
             f"Payment {payment_id} deleted and invoice {invoice_id} "
@@ -1,19 +1,52 @@
+from collections import OrderedDict
+from datetime import date
 from decimal import Decimal
+from functools import lru_cache
+import hashlib
 import logging
 import os
+import threading
 
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from app.utils.datetime_utils import MONTH_NAMES
 from app.utils.invoice_utils import calculate_invoice_totals
 from app.models.invoice import Invoice
+from app.models.payment import PaymentStatus
 from xhtml2pdf import pisa
 from io import BytesIO
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
 template_dir = os.path.join(os.path.dirname(__file__), '..', 'templates/pdf')
-jinja_env = Environment(loader=FileSystemLoader(template_dir))
+# Templates ship with the code, so skip per-render mtime checks; compiled
+# bytecode persists in the temp dir across worker restarts
+jinja_env = Environment(
+    loader=FileSystemLoader(template_dir),
+    bytecode_cache=FileSystemBytecodeCache(),
+    auto_reload=False
+)
 
 logger = logging.getLogger(__name__)
 
+_invoice_template: Template | None = None
+
+# Rendered PDFs keyed by a digest of their HTML. The HTML carries every
+# value printed on the invoice, so any edit, payment or status change is a
+# new key and stale entries just age out of the LRU.
+_PDF_CACHE_MAXSIZE = 64
+_pdf_cache: OrderedDict[bytes, bytes] = OrderedDict()
+_pdf_cache_lock = threading.Lock()
+
+
+def _get_invoice_template() -> Template:
+    """Return the invoice PDF template, loading it on first use."""
+
+    global _invoice_template
+
+    if _invoice_template is None:
+        _invoice_template = jinja_env.get_template('invoice.html')
+
+    return _invoice_template
+
 
 class PDFServiceError(Exception):
     """Base exception for PDF service errors"""
@@ -25,14 +58,48 @@ class PDFInvoiceNotFoundError(PDFServiceError):
     pass
 
 
+@lru_cache(maxsize=4096)
+def _format_date(value: date) -> str:
+    """Format as '05 January 2026' (strftime('%d %B %Y') without locale)."""
+
+    return f"{value.day:02d} {MONTH_NAMES[value.month - 1]} {value.year}"
+
+
+def _render_pdf(html_content: str) -> bytes:
+    """Convert invoice HTML to PDF bytes, reusing a cached rendering."""
+
+    key = hashlib.sha256(html_content.encode()).digest()
+
+    with _pdf_cache_lock:
+        pdf_bytes = _pdf_cache.get(key)
+        if pdf_bytes is not None:
+            _pdf_cache.move_to_end(key)
+            return pdf_bytes
+
+    buffer = BytesIO()
+    result = pisa.CreatePDF(html_content, dest=buffer)
+
+    if result.err:  # type: ignore
+        raise PDFServiceError("PDF generation failed")
+
+    pdf_bytes = buffer.getvalue()
+
+    with _pdf_cache_lock:
+        _pdf_cache[key] = pdf_bytes
+        if len(_pdf_cache) > _PDF_CACHE_MAXSIZE:
+            _pdf_cache.popitem(last=False)
+
+    return pdf_bytes
+
+
 def generate_invoice_pdf(invoice_id: int, db: Session) -> bytes:
     """Generate a PDF for an invoice"""
 
     invoice = db.query(Invoice)\
         .options(
             joinedload(Invoice.client),
-            joinedload(Invoice.items),
-            joinedload(Invoice.payments)
+            selectinload(Invoice.items),
+            selectinload(Invoice.payments)
     )\
         .filter(Invoice.id == invoice_id)\
         .first()
@@ -48,11 +115,10 @@ def generate_invoice_pdf(invoice_id: int, db: Session) -> bytes:
 
     for payment in invoice.payments:
         # Only count non-cancelled payments
-        from app.models.payment import PaymentStatus
         if payment.status != PaymentStatus.CANCELLED:
             total_paid += payment.amount_paid
             payment_history.append({
-                'date': payment.payment_date.strftime("%d %B %Y"),
+                'date': _format_date(payment.payment_date.date()),
                 'amount': payment.amount_paid,
                 'method': payment.payment_mode.replace('_', ' ').title(),
                 'reference': payment.reference_number or 'N/A'
@@ -64,12 +130,10 @@ def generate_invoice_pdf(invoice_id: int, db: Session) -> bytes:
     # Add to template context
     has_payments = len(payment_history) > 0
 
-    issue_date = invoice.date_value.strftime("%d %B %Y")
-    due_date = invoice.invoice_due.strftime("%d %B %Y")
+    issue_date = _format_date(invoice.date_value.date())
+    due_date = _format_date(invoice.invoice_due.date())
 
-    template = jinja_env.get_template('invoice.html')
-
-    html_content = template.render(
+    html_content = _get_invoice_template().render(
         invoice=invoice,
         issue_date=issue_date,
         due_date=due_date,
@@ -80,11 +144,4 @@ def generate_invoice_pdf(invoice_id: int, db: Session) -> bytes:
         remaining_balance=remaining_balance
     )
 
-    buffer = BytesIO()
-    result = pisa.CreatePDF(html_content, dest=buffer)
-
-    if result.err:  # type: ignore
-        raise PDFServiceError("PDF generation failed")
-
-    buffer.seek(0)
-    return buffer.getvalue()
+    return _render_pdf(html_content)
@@ -1,7 +1,9 @@
+from datetime import datetime
 import logging
 
 from celery import Task
 from celery.exceptions import Reject
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.config.database import SessionLocal
 from app.core.celery_app import celery_app
@@ -9,6 +11,12 @@ from app.core.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
 
+# Candidate invoices loaded per query by the overdue reminders task
+REMINDER_BATCH_SIZE = 500
+# Invoices per send_payment_reminders_batch_task; each batch's reminder logs
+# are committed together
+REMINDER_SEND_BATCH_SIZE = 50
+
 
 def get_task_db_session():
     """
@@ -27,6 +35,40 @@ def get_task_db_session():
         db.close()
 
 
+def _commit_reminder_logs(db, pending: list) -> None:
+    """
+    Commit buffered reminder log updates in one transaction.
+
+    If the batch commit fails, the updates are re-applied and committed one
+    invoice at a time so a single bad row does not lose the others.
+    """
+    if not pending:
+        return
+
+    try:
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        logger.warning(
+            f"Batch commit of {len(pending)} reminder logs failed, "
+            f"retrying per invoice",
+            exc_info=True
+        )
+
+        for invoice, reminder_logs in pending:
+            try:
+                invoice.reminder_logs = reminder_logs
+                db.commit()
+            except SQLAlchemyError:
+                db.rollback()
+                logger.error(
+                    f"Failed to record reminder for invoice {invoice.id}",
+                    exc_info=True
+                )
+
+    pending.clear()
+
+
 @celery_app.task(
     bind=True,
     name='email.send_invoice',
@@ -251,6 +293,161 @@ def send_payment_confirmation_task(self: Task, payment_id: int) -> dict:
             pass
 
 
+@celery_app.task(
+    bind=True,
+    name='email.send_payment_reminders_batch',
+    time_limit=300,
+    soft_time_limit=240,
+    acks_late=True,
+    reject_on_worker_lost=True,
+)
+def send_payment_reminders_batch_task(self: Task, invoice_ids: list[int]) -> dict:
+    """
+    Send payment reminders for one batch of overdue invoices.
+
+    Fanned out by send_overdue_reminders_task. Each invoice is re-checked
+    against should_send_reminder first, so a redelivered or duplicated
+    batch skips invoices already reminded. Emails go out concurrently over
+    one HTTP client and the batch's reminder logs are committed together.
+
+    Args:
+        invoice_ids: IDs of invoices selected for a reminder
+
+    Returns:
+        Dict with reminders_sent, reminders_skipped, reminders_failed and
+        errors (invoice_id, invoice_no, error per failed send)
+    """
+    import asyncio
+
+    from app.models.invoice import Invoice
+    from app.services.email_service import send_payment_reminders_bulk
+    from app.utils.datetime_utils import get_current_timezone
+    from app.utils.invoice_utils import should_send_reminder
+
+    db_gen = get_task_db_session()
+    db = next(db_gen)
+
+    stats = {
+        "reminders_sent": 0,
+        "reminders_skipped": 0,
+        "reminders_failed": 0,
+        "errors": []
+    }
+
+    # (invoice, reminder_logs) updates not yet committed
+    pending_logs = []
+
+    try:
+        current_time = get_current_timezone("Africa/Lagos")
+
+        invoices = {
+            invoice.id: invoice
+            for invoice in db.query(Invoice)
+            .filter(Invoice.id.in_(invoice_ids))
+            .all()
+        }
+
+        due_ids = []
+        for invoice_id in invoice_ids:
+            invoice = invoices.get(invoice_id)
+            if invoice and should_send_reminder(
+                    invoice, current_time, "Africa/Lagos")[0]:
+                due_ids.append(invoice_id)
+            else:
+                stats["reminders_skipped"] += 1
+
+        results = asyncio.run(send_payment_reminders_bulk(due_ids, db)) \
+            if due_ids else {}
+
+        for invoice_id, outcome in results.items():
+            invoice = invoices[invoice_id]
+
+            if isinstance(outcome, Exception):
+                stats["reminders_failed"] += 1
+                stats["errors"].append({
+                    "invoice_id": invoice_id,
+                    "invoice_no": invoice.invoice_no,
+                    "error": str(outcome)
+                })
+                logger.error(
+                    f"Failed to send reminder for invoice {invoice_id}: {str(outcome)}"
+                )
+                continue
+
+            # Update reminder logs with timezone-aware timestamp; assign a
+            # new dict so the JSON column sees the change
+            reminder_logs = dict(invoice.reminder_logs or {})
+            reminder_logs['last_sent'] = current_time.isoformat()
+            reminder_logs['count'] = reminder_logs.get('count', 0) + 1
+            invoice.reminder_logs = reminder_logs
+
+            pending_logs.append((invoice, reminder_logs))
+            stats["reminders_sent"] += 1
+
+        _commit_reminder_logs(db, pending_logs)
+
+        logger.info(
+            "Payment reminder batch completed",
+            extra={"task_id": self.request.id, "stats": stats}
+        )
+
+        return stats
+
+    except Exception as e:
+        # Reminders already emailed must still be logged, or a rerun
+        # would send them again
+        _commit_reminder_logs(db, pending_logs)
+
+        logger.error(
+            f"Error in payment reminder batch: {str(e)}",
+            extra={"task_id": self.request.id, "invoice_ids": invoice_ids},
+            exc_info=True
+        )
+        raise
+
+    finally:
+        try:
+            next(db_gen, None)
+        except StopIteration:
+            pass
+
+
+def _reminder_frequency_met(current_time: datetime):
+    """
+    PostgreSQL clause for should_send_reminder's frequency rule.
+
+    Unparseable last_sent values stay in, matching its "send anyway" rule.
+    Like normalize_datetime, a timestamp without an offset is read as Lagos
+    time rather than in the DB session's time zone.
+    """
+    from sqlalchemy import DateTime, case, cast, func, or_
+
+    from app.models.invoice import Invoice
+
+    last_sent = Invoice.reminder_logs['last_sent'].as_string()
+    last_sent_at = case(
+        (
+            last_sent.regexp_match(
+                r'\d{2}:\d{2}(:\d{2}(\.\d+)?)?\s*(Z|[+-]\d{2}(:?\d{2})?)$'),
+            cast(last_sent, DateTime(timezone=True))
+        ),
+        else_=func.timezone('Africa/Lagos', cast(last_sent, DateTime()))
+    )
+
+    return or_(
+        last_sent.is_(None),
+        case(
+            (
+                last_sent.regexp_match(r'^\d{4}-\d{2}-\d{2}'),
+                last_sent_at
+                + func.make_interval(0, 0, 0, Invoice.reminder_frequency)
+                <= current_time
+            ),
+            else_=True
+        )
+    )
+
+
 @celery_app.task(
     bind=True,
     name='email.send_overdue_reminders',
@@ -259,16 +456,26 @@ def send_payment_confirmation_task(self: Task, payment_id: int) -> dict:
     acks_late=True,
 )
 def send_overdue_reminders_task(self: Task) -> dict:
-    """Scheduled task: Send payment reminders for overdue invoices."""
+    """
+    Scheduled task: Queue payment reminders for overdue invoices.
+
+    Selects due invoices by their reminder columns only and fans the sends
+    out as a group of send_payment_reminders_batch_task subtasks, so
+    reminders go out in parallel across workers. Per-send outcomes are
+    logged by the subtasks (no chord: the result backend is optional).
+
+    Returns:
+        Dict with total_checked, reminders_queued, reminders_skipped,
+        batches_queued and skip_reasons. The reminders_sent,
+        reminders_failed and errors this task used to return are now
+        reported per batch by send_payment_reminders_batch_task.
+    """
+
+    from celery import group
 
-    from datetime import datetime
     from app.models.invoice import Invoice, InvoiceStatus
-    from app.services.email_service import (
-        send_payment_reminder,
-        EmailServiceError
-    )
     from app.utils.datetime_utils import get_current_timezone
-    from app.utils.invoice_utils import should_send_reminder, normalize_datetime
+    from app.utils.invoice_utils import should_send_reminder
 
     logger.info(
         "Starting scheduled overdue reminders task",
@@ -280,84 +487,90 @@ def send_overdue_reminders_task(self: Task) -> dict:
 
     stats = {
         "total_checked": 0,
-        "reminders_sent": 0,
+        "reminders_queued": 0,
         "reminders_skipped": 0,
-        "reminders_failed": 0,
-        "skip_reasons": {},
-        "errors": []
+        "batches_queued": 0,
+        "skip_reasons": {}
     }
 
     try:
         # Get current time (timezone-aware)
         current_time = get_current_timezone("Africa/Lagos")
 
-        # Query invoices that MIGHT need reminders
-        candidate_invoices = db.query(Invoice).filter(
+        # Only the columns should_send_reminder reads; rows are not ORM
+        # objects, so nothing accumulates in the session
+        candidate_query = db.query(
+            Invoice.id,
+            Invoice.invoice_due,
+            Invoice.status,
+            Invoice.send_reminders,
+            Invoice.reminder_frequency,
+            Invoice.reminder_logs
+        ).filter(
             Invoice.status.notin_(
                 [InvoiceStatus.PAID, InvoiceStatus.CANCELLED]),
             Invoice.send_reminders == True,
             Invoice.reminder_frequency.isnot(None),
             Invoice.invoice_due < current_time  # Database comparison
-        ).all()
-
-        stats["total_checked"] = len(candidate_invoices)
-
-        logger.info(f"Found {stats['total_checked']} candidate invoices")
-
-        for invoice in candidate_invoices:
-            try:
-                # Apply business rules (handles naive/aware comparison)
-                should_send, reason = should_send_reminder(
-                    invoice,
-                    current_time,
-                    "Africa/Lagos"  # ← Added timezone parameter
-                )
-
-                if should_send:
-                    # Send reminder email
-                    email_id = send_payment_reminder(
-                        invoice_id=invoice.id,
-                        db=db
-                    )
-
-                    # Update reminder logs with timezone-aware timestamp
-                    if not invoice.reminder_logs:
-                        invoice.reminder_logs = {}
-
-                    invoice.reminder_logs['last_sent'] = current_time.isoformat(
-                    )
-                    invoice.reminder_logs['count'] = invoice.reminder_logs.get(
-                        'count', 0) + 1
-
-                    db.commit()
-
-                    stats["reminders_sent"] += 1
-
-                    logger.info(
-                        f"Reminder sent for invoice {invoice.invoice_no}",
-                        extra={"invoice_id": invoice.id, "email_id": email_id}
-                    )
-                else:
-                    stats["reminders_skipped"] += 1
-                    stats["skip_reasons"][reason] = stats["skip_reasons"].get(
-                        reason, 0) + 1
+        )
 
-                    logger.debug(
-                        f"Skipping reminder for invoice {invoice.invoice_no}: {reason}"
+        if db.get_bind().dialect.name == 'postgresql':
+            # Rule 5 (reminder frequency) in SQL, so invoices reminded too
+            # recently are never fetched; should_send_reminder still runs
+            # as the final check
+            candidate_query = candidate_query.filter(
+                _reminder_frequency_met(current_time))
+
+        # Walk candidates in keyset batches on Invoice.id so memory stays
+        # flat however many invoices are overdue
+        last_id = 0
+
+        # One broker producer (and connection) publishes every batch of the
+        # run instead of acquiring one per group
+        with celery_app.producer_or_acquire() as producer:
+            while True:
+                candidates = candidate_query\
+                    .filter(Invoice.id > last_id)\
+                    .order_by(Invoice.id)\
+                    .limit(REMINDER_BATCH_SIZE)\
+                    .all()
+
+                if not candidates:
+                    break
+
+                last_id = candidates[-1].id
+                stats["total_checked"] += len(candidates)
+
+                due_ids = []
+                for candidate in candidates:
+                    # Apply business rules (handles naive/aware comparison)
+                    should_send, reason = should_send_reminder(
+                        candidate,
+                        current_time,
+                        "Africa/Lagos"
                     )
 
-            except EmailServiceError as e:
-                stats["reminders_failed"] += 1
-                stats["errors"].append({
-                    "invoice_id": invoice.id,
-                    "invoice_no": invoice.invoice_no,
-                    "error": str(e)
-                })
-                logger.error(
-                    f"Failed to send reminder for invoice {invoice.id}: {str(e)}",
-                    exc_info=True
-                )
-                continue
+                    if should_send:
+                        due_ids.append(candidate.id)
+                    else:
+                        stats["reminders_skipped"] += 1
+                        stats["skip_reasons"][reason] = stats["skip_reasons"].get(
+                            reason, 0) + 1
+
+                if not due_ids:
+                    continue
+
+                batches = [
+                    due_ids[i:i + REMINDER_SEND_BATCH_SIZE]
+                    for i in range(0, len(due_ids), REMINDER_SEND_BATCH_SIZE)
+                ]
+                group(
+                    send_payment_reminders_batch_task.s(batch)
+                    for batch in batches
+                ).apply_async(producer=producer)
+
+                stats["reminders_queued"] += len(due_ids)
+                stats["batches_queued"] += len(batches)
 
         logger.info(
             "Overdue reminders task completed",
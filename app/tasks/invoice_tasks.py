@@ -81,7 +81,7 @@ def generate_invoice_pdf_task(self: Task, invoice_id: int) -> dict:
 
         # Get invoice info for filename
         from app.models.invoice import Invoice
-        invoice = db.query(Invoice).filter(Invoice.id == invoice_id).first()
+        invoice = db.get(Invoice, invoice_id)
 
         if not invoice:
             raise PDFInvoiceNotFoundError(f"Invoice {invoice_id} not found")
@@ -227,8 +227,7 @@ def generate_and_send_invoice_task(self: Task, invoice_id: int) -> dict:
             pdf_bytes = generate_invoice_pdf(invoice_id=invoice_id, db=db)
 
             from app.models.invoice import Invoice
-            invoice = db.query(Invoice).filter(
-                Invoice.id == invoice_id).first()
+            invoice = db.get(Invoice, invoice_id)
 
             if not invoice:
                 raise PDFInvoiceNotFoundError(
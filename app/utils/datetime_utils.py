@@ -3,8 +3,20 @@ from typing import Tuple
 from zoneinfo import ZoneInfo
 
 
-def get_timezone(tz: str = "Africa/Lagos") -> ZoneInfo:
-    """Get timezone object"""
+# Default business timezone, resolved once at import
+LAGOS_TZ = ZoneInfo("Africa/Lagos")
+
+# English month names for locale-free date formatting (%B without strftime)
+MONTH_NAMES = (
+    'January', 'February', 'March', 'April', 'May', 'June', 'July',
+    'August', 'September', 'October', 'November', 'December'
+)
+
+
+def get_timezone(tz: str | ZoneInfo = "Africa/Lagos") -> ZoneInfo:
+    """Get timezone object (a ZoneInfo is returned as-is)"""
+    if isinstance(tz, ZoneInfo):
+        return tz
     return ZoneInfo(tz)
 
 
@@ -14,7 +26,7 @@ def get_timeaware(dateobj: datetime, timez: str = "Africa/Lagos") -> datetime:
     return dateobj.astimezone(tz)
 
 
-def get_current_timezone(timez: str = "Africa/Lagos") -> datetime:
+def get_current_timezone(timez: str | ZoneInfo = "Africa/Lagos") -> datetime:
     """Get current time in specified timezone"""
     tz = get_timezone(timez)
     return datetime.now(tz)
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from decimal import Decimal, ROUND_HALF_UP
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
 from typing import TypedDict, Literal, TypeGuard
 
 from app.models.invoice import Invoice
@@ -10,6 +10,8 @@ VAT_RATE = Decimal("7.5")
 CLIENT_TYPE_STUDENT = 1
 CLIENT_TYPE_INDIVIDUAL = 2
 CLIENT_TYPE_CORPORATE = 3
+ZERO = Decimal("0.00")
+CENT = Decimal("0.01")
 
 DiscountType = Literal["fixed", "percent", "percentage"]
 
@@ -61,7 +63,8 @@ def calculate_discount(
         else:
             return Decimal('0.00')
 
-    except (ValueError, TypeError):
+    # Decimal() raises InvalidOperation on free-form text such as "10%"
+    except (ValueError, TypeError, InvalidOperation):
         return Decimal('0.00')
 
 
@@ -93,23 +96,37 @@ def calculate_vat(
         return rate * amt
 
 
+def calculate_line_amount(qty: int, rate: int | Decimal) -> Decimal:
+    """Line item amount (qty x rate), rounded half-up to the cent."""
+
+    # qty and rate are integer columns: Decimal(int) is exact, no str() trip
+    return (Decimal(qty) * rate).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
 def calculate_invoice_totals(invoice: Invoice) -> InvoiceTotals:
     """Calculate all invoice totals from line items, discount, and VAT"""
 
-    subtotal = Decimal('0.00')
+    subtotal = ZERO
 
     if not invoice.items:
         return {
-            "subtotal": Decimal('0.00'),
-            "discount": Decimal('0.00'),
-            "total": Decimal('0.00'),
-            "vat": Decimal('0.00'),
-            "vat_total": Decimal('0.00')
+            "subtotal": ZERO,
+            "discount": ZERO,
+            "total": ZERO,
+            "vat": ZERO,
+            "vat_total": ZERO
         }
 
     for item in invoice.items:
+        amount = item.amount
+
+        # DECIMAL columns already load as Decimal; skip the str() round-trip
+        if isinstance(amount, Decimal):
+            subtotal += amount
+            continue
+
         try:
-            subtotal += Decimal(str(item.amount))
+            subtotal += Decimal(str(amount))
         except (ValueError, TypeError):
             continue
 
@@ -129,14 +146,22 @@ def calculate_invoice_totals(invoice: Invoice) -> InvoiceTotals:
         vat_total = total_after_discount + vat
 
     return {
-        "subtotal": subtotal.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-        "discount": discount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-        "total": total_after_discount.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-        "vat": vat.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP),
-        "vat_total": vat_total.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        "subtotal": subtotal.quantize(CENT, rounding=ROUND_HALF_UP),
+        "discount": discount.quantize(CENT, rounding=ROUND_HALF_UP),
+        "total": total_after_discount.quantize(CENT, rounding=ROUND_HALF_UP),
+        "vat": vat.quantize(CENT, rounding=ROUND_HALF_UP),
+        "vat_total": vat_total.quantize(CENT, rounding=ROUND_HALF_UP)
     }
 
 
+def refresh_invoice_total(invoice: Invoice) -> Decimal:
+    """Recalculate and store the persisted vat_total for an invoice."""
+
+    totals = calculate_invoice_totals(invoice)
+    invoice.vat_total = totals["vat_total"]
+    return invoice.vat_total
+
+
 def calculate_totals_from_values(
     disc_type: DiscountType | None,
     disc_value: Decimal | float | str | None,
@@ -202,17 +227,6 @@ def figure2decimal(value: str) -> Decimal:
     return float2decimal(value)
 
 
-def track_invoice_view(invoice: Invoice) -> None:
-    """Update view tracking fields when invoice is accessed."""
-
-    if invoice.view_count is None:
-        invoice.view_count = 1
-    else:
-        invoice.view_count += 1
-
-    invoice.last_view = datetime.now()
-
-
 def calculate_due_date(invoice_date: datetime, payment_terms_days: int = 30) -> datetime:
     """Calculate invoice due date based on payment terms."""
     return invoice_date + timedelta(days=payment_terms_days)
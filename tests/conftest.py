@@ -2,17 +2,34 @@
 
 import os
 
+TEST_DATABASE_URL = 'sqlite:///./test.db'
+
+# Settings are read at import time, so the environment must be set before
+# anything under app/ is imported
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+os.environ["TESTING"] = "1"
+os.environ.setdefault("RESEND_API_KEY", "test-resend-key")
+os.environ.setdefault("UPSTASH_REDIS_BROKER_URL", "memory://")
+
+from datetime import datetime, timedelta
+
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import BigInteger, create_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker
 
 from app.config.database import Base
+import app.models  # noqa: F401  (register every table on Base.metadata)
+from app.models.client import Client
+from app.schemas.invoice import InvoiceCreate
+from app.schemas.item import ItemCreate
+from app.services.invoice_service import create_invoice
 
 
-TEST_DATABASE_URL = 'sqlite:///./test.db'
-
-os.environ["DATABASE_URL"] = TEST_DATABASE_URL
-os.environ["TESTING"] = "1"
+@compiles(BigInteger, 'sqlite')
+def _compile_big_integer_sqlite(type_, compiler, **kw):
+    """SQLite only autoincrements INTEGER PRIMARY KEY columns."""
+    return 'INTEGER'
 
 
 engine = create_engine(TEST_DATABASE_URL, connect_args={
@@ -34,3 +51,38 @@ def db_session():
     finally:
         db.close()
         Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def sample_client(db_session):
+    """A persisted client to hang invoices off"""
+
+    client = Client(
+        name="Ada Lovelace",
+        address="12 Marina Road, Lagos",
+        email="ada@example.com",
+        phone="08030000000",
+        post_addr="100001"
+    )
+    db_session.add(client)
+    db_session.commit()
+    return client
+
+
+@pytest.fixture
+def make_invoice(db_session, sample_client):
+    """Create invoices for sample_client through the invoice service"""
+
+    def make(items=None, **fields):
+        data = {
+            "invoice_no": "DRAFT",
+            "invoice_due": datetime.now() + timedelta(days=30),
+            "client_type": 2,
+            "currency": 1,
+            "client_id": sample_client.id,
+            "items": items or [ItemCreate(item_desc="Design", qty=2, rate=1000)],
+        }
+        data.update(fields)
+        return create_invoice(InvoiceCreate(**data), db_session)
+
+    return make
@@ -0,0 +1,99 @@
+"""Login and the short-lived cache of rejected credentials."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.exceptions import UnauthorizedException
+from app.core.security import hash_password
+from app.models.user import User
+from app.services import auth_service
+from app.services.auth_service import authenticate_user
+
+
+PASSWORD = "correct-horse-battery"
+
+
+@pytest.fixture
+def user(db_session):
+    user = User(username="ada", password=hash_password(PASSWORD), is_active=True)
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(
+        auth_service, "time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+@pytest.fixture
+def kdf_calls(monkeypatch):
+    """Count real password verifications."""
+
+    calls = []
+    verify = auth_service.verify_password
+
+    def counting_verify(password, password_hash):
+        calls.append(password)
+        return verify(password, password_hash)
+
+    monkeypatch.setattr(auth_service, "verify_password", counting_verify)
+    auth_service._failed_logins.clear()
+    yield calls
+    auth_service._failed_logins.clear()
+
+
+def _fail(db, password: str = "wrong-password") -> None:
+    with pytest.raises(UnauthorizedException):
+        authenticate_user("ada", password, db)
+
+
+def test_repeated_wrong_password_is_served_from_cache(db_session, user, clock, kdf_calls):
+    _fail(db_session)
+    _fail(db_session)
+
+    assert len(kdf_calls) == 1
+
+
+def test_cached_rejection_expires_after_ttl(db_session, user, clock, kdf_calls):
+    _fail(db_session)
+
+    clock[0] += auth_service._FAILED_LOGIN_TTL
+    _fail(db_session)
+
+    assert len(kdf_calls) == 2
+
+
+def test_cache_hit_does_not_extend_ttl(db_session, user, clock, kdf_calls):
+    _fail(db_session)
+
+    clock[0] += auth_service._FAILED_LOGIN_TTL - 1
+    _fail(db_session)
+    assert len(kdf_calls) == 1
+
+    clock[0] += 1
+    _fail(db_session)
+    assert len(kdf_calls) == 2
+
+
+def test_correct_password_right_after_a_failure(db_session, user, clock, kdf_calls):
+    _fail(db_session)
+
+    access_token, refresh_token, logged_in = authenticate_user(
+        "ada", PASSWORD, db_session)
+
+    assert logged_in.id == user.id
+    assert access_token and refresh_token
+
+
+def test_cache_is_bounded(monkeypatch, clock, kdf_calls):
+    monkeypatch.setattr(auth_service, "_FAILED_LOGIN_MAXSIZE", 3)
+
+    for n in range(5):
+        auth_service._remember_failed_login(bytes([n]))
+
+    assert list(auth_service._failed_logins) == [bytes([2]), bytes([3]), bytes([4])]
@@ -0,0 +1,19 @@
+"""Client email normalization."""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.client import ClientUpdate
+
+
+def test_ascii_email_lowercases_domain_only():
+    assert ClientUpdate(email="Ada@Example.COM").email == "Ada@example.com"
+
+
+def test_missing_email_passes_through():
+    assert ClientUpdate(name="Ada").email is None
+
+
+def test_malformed_email_is_rejected():
+    with pytest.raises(ValidationError):
+        ClientUpdate(email="not-an-email")
@@ -0,0 +1,136 @@
+"""In-process dashboard stats cache: hits, TTL expiry and invalidation."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.config import settings
+from app.models.client import Client
+from app.services import analytics_service
+from app.services.analytics_service import (
+    get_dashboard_stats,
+    invalidate_dashboard_cache,
+    invalidate_dashboard_cache_on_commit
+)
+
+
+EMPTY_RESULTS = {
+    'status_rollup': {},
+    'counts': {'total_clients': 0, 'total_payments': 0},
+    'monthly_revenue': [],
+    'top_clients': [],
+    'recent_invoices': [],
+    'recent_payments': [],
+}
+
+
+@pytest.fixture
+def query_calls(monkeypatch):
+    """Count dashboard query runs instead of hitting the database."""
+
+    calls = []
+
+    def fake_run(db, session_factory=None):
+        calls.append(db)
+        return EMPTY_RESULTS
+
+    monkeypatch.setattr(analytics_service, '_run_dashboard_queries', fake_run)
+    invalidate_dashboard_cache()
+    yield calls
+    invalidate_dashboard_cache()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Drive the cache's monotonic clock by hand."""
+
+    now = [1000.0]
+    monkeypatch.setattr(
+        analytics_service, 'time', SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
+def _add_client(db, email: str) -> None:
+    db.add(Client(
+        name="Grace Hopper",
+        address="3 Awolowo Road, Lagos",
+        email=email,
+        phone="08031111111",
+        post_addr="100002"
+    ))
+
+
+def test_repeat_request_is_served_from_cache(db_session, query_calls):
+    first = get_dashboard_stats(db_session, user_id=1)
+    second = get_dashboard_stats(db_session, user_id=1)
+
+    assert len(query_calls) == 1
+    assert second is first
+
+
+def test_cache_is_per_user(db_session, query_calls):
+    get_dashboard_stats(db_session, user_id=1)
+    get_dashboard_stats(db_session, user_id=2)
+
+    assert len(query_calls) == 2
+
+
+def test_entry_expires_after_ttl(db_session, query_calls, clock):
+    get_dashboard_stats(db_session, user_id=1)
+
+    clock[0] += settings.DASHBOARD_CACHE_TTL - 1
+    get_dashboard_stats(db_session, user_id=1)
+    assert len(query_calls) == 1
+
+    clock[0] += 1
+    get_dashboard_stats(db_session, user_id=1)
+    assert len(query_calls) == 2
+
+
+def test_write_invalidates_only_after_commit(db_session, query_calls):
+    get_dashboard_stats(db_session, user_id=1)
+
+    _add_client(db_session, "grace@example.com")
+    db_session.flush()
+    invalidate_dashboard_cache_on_commit(db_session)
+
+    # Still uncommitted: the cached payload stays in place
+    get_dashboard_stats(db_session, user_id=1)
+    assert len(query_calls) == 1
+
+    db_session.commit()
+    get_dashboard_stats(db_session, user_id=1)
+    assert len(query_calls) == 2
+
+
+def test_rolled_back_write_keeps_cache(db_session, query_calls):
+    get_dashboard_stats(db_session, user_id=1)
+
+    _add_client(db_session, "grace@example.com")
+    db_session.flush()
+    invalidate_dashboard_cache_on_commit(db_session)
+    db_session.rollback()
+
+    # A later unrelated commit must not pick up the discarded flag
+    _add_client(db_session, "hopper@example.com")
+    db_session.commit()
+
+    get_dashboard_stats(db_session, user_id=1)
+    assert len(query_calls) == 1
+
+
+def test_result_computed_across_an_invalidation_is_not_cached(
+    db_session, query_calls, monkeypatch
+):
+    def run_then_invalidate(db, session_factory=None):
+        query_calls.append(db)
+        invalidate_dashboard_cache()
+        return EMPTY_RESULTS
+
+    monkeypatch.setattr(
+        analytics_service, '_run_dashboard_queries', run_then_invalidate)
+
+    get_dashboard_stats(db_session, user_id=1)
+    get_dashboard_stats(db_session, user_id=1)
+
+    assert len(query_calls) == 2
@@ -0,0 +1,25 @@
+"""IntegrityError messages surfaced by transaction_scope."""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.services.database import _extract_constraint_name
+
+
+def _integrity_error(message: str) -> IntegrityError:
+    return IntegrityError("INSERT ...", {}, Exception(message))
+
+
+@pytest.mark.parametrize("message, expected", [
+    ('duplicate key value violates unique constraint "users_username_key"\n'
+     'DETAIL:  Key (username)=(ada) already exists.',
+     "Username already taken"),
+    ('duplicate key value violates unique constraint "client_email_key"\n'
+     'DETAIL:  Key (email)=(ada@example.com) already exists.',
+     "Email address already registered"),
+    ('DETAIL:  Key (reference_number)=(TRF-001) already exists.',
+     "Duplicate value for unique field"),
+    ('deadlock detected', "Database constraint violated"),
+])
+def test_constraint_messages(message, expected):
+    assert _extract_constraint_name(_integrity_error(message)) == expected
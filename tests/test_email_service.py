@@ -0,0 +1,59 @@
+"""Email payload building and template rendering."""
+
+import base64
+
+import pytest
+
+from app.services import email_service
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Capture Resend payloads instead of posting them."""
+
+    payloads = []
+
+    def fake_post(params):
+        payloads.append(params)
+        return "email-id"
+
+    monkeypatch.setattr(email_service, "_post_email", fake_post)
+    return payloads
+
+
+def test_attachment_bytes_are_base64_encoded(sent):
+    pdf = b"%PDF-1.7 fake invoice" * 100
+
+    email_service.send_email_with_attachment(
+        to="ada@example.com",
+        subject="Invoice",
+        html="<p>Hi</p>",
+        attachment_name="INV-1.pdf",
+        attachment_bytes=pdf
+    )
+
+    (attachment,) = sent[0]["attachments"]
+    assert attachment["filename"] == "INV-1.pdf"
+    assert base64.b64decode(attachment["content"]) == pdf
+
+
+def test_plain_email_has_no_attachments(sent):
+    email_service.send_email("ada@example.com", "Hello", "<p>Hi</p>")
+
+    assert "attachments" not in sent[0]
+
+
+def test_invoice_number_is_escaped_in_invoice_email(
+    db_session, make_invoice, sent, monkeypatch
+):
+    monkeypatch.setattr(
+        email_service, "generate_invoice_pdf", lambda invoice_id, db: b"%PDF")
+    invoice = make_invoice()
+    invoice.invoice_no = "<b>INV</b>"
+    db_session.commit()
+
+    email_service.send_invoice_email(invoice.id, db_session)
+
+    html = sent[0]["html"]
+    assert "&lt;b&gt;INV&lt;/b&gt;" in html
+    assert "<b>INV</b>" not in html
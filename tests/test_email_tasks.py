@@ -0,0 +1,158 @@
+"""Overdue reminder fan-out and the per-batch reminder task."""
+
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import celery
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.celery_app import celery_app
+from app.services import email_service
+from app.tasks import email_tasks
+from app.tasks.email_tasks import (
+    send_overdue_reminders_task,
+    send_payment_reminders_batch_task
+)
+from app.utils.datetime_utils import get_current_timezone
+
+
+@pytest.fixture(autouse=True)
+def task_session(db_session, monkeypatch):
+    """Run the tasks on the test session instead of SessionLocal."""
+
+    monkeypatch.setattr(
+        email_tasks, "get_task_db_session", lambda: iter([db_session]))
+
+
+@pytest.fixture
+def overdue_invoices(db_session, make_invoice):
+    """Three overdue invoices with reminders enabled and none sent yet."""
+
+    return [
+        make_invoice(
+            invoice_due=datetime.now() - timedelta(days=10),
+            send_reminders=True,
+            reminder_frequency=3
+        )
+        for _ in range(3)
+    ]
+
+
+@pytest.fixture
+def sends(monkeypatch):
+    """
+    Stand in for the Resend HTTP call; sends for invoice numbers added to
+    failing fail the way a rejected request would.
+    """
+
+    sent = []
+    failing = set()
+
+    async def fake_send(params, client):
+        if any(invoice_no in params["subject"] for invoice_no in failing):
+            raise email_service.EmailSendError("Resend rejected the request")
+        sent.append(params["subject"])
+        return f"email-{len(sent)}"
+
+    monkeypatch.setattr(email_service, "send_email_async", fake_send)
+    return SimpleNamespace(sent=sent, failing=failing)
+
+
+def _reminded(db, invoice) -> bool:
+    db.refresh(invoice)
+    return bool(invoice.reminder_logs and invoice.reminder_logs.get("last_sent"))
+
+
+def test_batch_records_only_successful_sends(db_session, overdue_invoices, sends):
+    first, second, third = overdue_invoices
+    sends.failing.add(second.invoice_no)
+
+    stats = send_payment_reminders_batch_task([i.id for i in overdue_invoices])
+
+    assert stats["reminders_sent"] == 2
+    assert stats["reminders_failed"] == 1
+    assert [e["invoice_id"] for e in stats["errors"]] == [second.id]
+    assert _reminded(db_session, first)
+    assert not _reminded(db_session, second)
+    assert _reminded(db_session, third)
+
+
+def test_batch_commit_failure_falls_back_to_per_row_commits(
+    db_session, overdue_invoices, sends, monkeypatch
+):
+    first, second, third = overdue_invoices
+    real_commit = db_session.commit
+    # Batch commit fails, then the second invoice's own commit fails too
+    outcomes = iter([False, True, False, True])
+
+    def flaky_commit():
+        if not next(outcomes, True):
+            raise SQLAlchemyError("simulated commit failure")
+        real_commit()
+
+    monkeypatch.setattr(db_session, "commit", flaky_commit)
+
+    stats = send_payment_reminders_batch_task([i.id for i in overdue_invoices])
+
+    assert stats["reminders_sent"] == 3
+    assert _reminded(db_session, first)
+    assert not _reminded(db_session, second)
+    assert _reminded(db_session, third)
+
+
+def test_batch_rechecks_should_send_reminder(db_session, overdue_invoices, sends):
+    first, second, third = overdue_invoices
+    second.reminder_logs = {
+        "last_sent": get_current_timezone("Africa/Lagos").isoformat(),
+        "count": 1
+    }
+    db_session.commit()
+
+    stats = send_payment_reminders_batch_task([i.id for i in overdue_invoices])
+
+    assert stats["reminders_sent"] == 2
+    assert stats["reminders_skipped"] == 1
+    assert len(sends.sent) == 2
+    assert all(second.invoice_no not in subject for subject in sends.sent)
+
+
+def test_overdue_task_fans_out_batches(
+    db_session, make_invoice, overdue_invoices, monkeypatch
+):
+    make_invoice(invoice_due=datetime.now() + timedelta(days=10),
+                 send_reminders=True, reminder_frequency=3)
+
+    published = []
+
+    class FakeGroup:
+        def __init__(self, signatures):
+            self.batches = [sig.args[0] for sig in signatures]
+
+        def apply_async(self, producer=None):
+            published.append((self.batches, producer))
+
+    monkeypatch.setattr(celery, "group", FakeGroup)
+    monkeypatch.setattr(
+        celery_app, "producer_or_acquire", lambda: nullcontext("producer"))
+    monkeypatch.setattr(email_tasks, "REMINDER_SEND_BATCH_SIZE", 2)
+
+    stats = send_overdue_reminders_task()
+
+    ids = [invoice.id for invoice in overdue_invoices]
+    assert published == [([ids[:2], ids[2:]], "producer")]
+    assert stats["reminders_queued"] == 3
+    assert stats["batches_queued"] == 2
+    assert "reminders_sent" not in stats
+
+
+def test_frequency_prefilter_reads_naive_last_sent_as_lagos_time():
+    from sqlalchemy.dialects import postgresql
+
+    clause = email_tasks._reminder_frequency_met(
+        get_current_timezone("Africa/Lagos"))
+    compiled = clause.compile(dialect=postgresql.dialect())
+
+    assert "timezone(" in str(compiled)
+    assert "Africa/Lagos" in compiled.params.values()
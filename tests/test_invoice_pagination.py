@@ -0,0 +1,68 @@
+"""Offset and cursor pagination of the invoice list."""
+
+import pytest
+
+from app.core.exceptions import ValidationException
+from app.services.invoice_service import get_invoices_paginated
+
+
+@pytest.fixture
+def invoice_ids(make_invoice):
+    """Five invoices, newest (highest id) first, as the list orders them."""
+
+    return sorted((make_invoice().id for _ in range(5)), reverse=True)
+
+
+def _ids(result: dict) -> list[int]:
+    return [invoice.id for invoice in result["invoices"]]
+
+
+def test_first_page(db_session, invoice_ids):
+    result = get_invoices_paginated(db_session, page=1, limit=2)
+
+    assert _ids(result) == invoice_ids[:2]
+    assert result["pagination"] == {
+        "page": 1,
+        "limit": 2,
+        "total": 5,
+        "total_pages": 3,
+        "next_cursor": invoice_ids[1]
+    }
+
+
+def test_cursor_chain_keeps_global_totals(db_session, invoice_ids):
+    first = get_invoices_paginated(db_session, limit=2)
+    second = get_invoices_paginated(
+        db_session, limit=2, cursor=first["pagination"]["next_cursor"])
+    last = get_invoices_paginated(
+        db_session, limit=2, cursor=second["pagination"]["next_cursor"])
+
+    assert _ids(second) == invoice_ids[2:4]
+    assert second["pagination"]["page"] == 2
+    assert second["pagination"]["total"] == 5
+    assert second["pagination"]["total_pages"] == 3
+
+    assert _ids(last) == invoice_ids[4:]
+    assert last["pagination"]["page"] == 3
+    assert last["pagination"]["total"] == 5
+    assert last["pagination"]["next_cursor"] is None
+
+
+def test_cursor_page_ignores_page_argument(db_session, invoice_ids):
+    result = get_invoices_paginated(
+        db_session, page=7, limit=2, cursor=invoice_ids[1])
+
+    assert result["pagination"]["page"] == 2
+
+
+def test_offset_page_past_the_end(db_session, invoice_ids):
+    result = get_invoices_paginated(db_session, page=4, limit=2)
+
+    assert result["invoices"] == []
+    assert result["pagination"]["total"] == 5
+    assert result["pagination"]["next_cursor"] is None
+
+
+def test_bad_cursor_is_rejected(db_session, invoice_ids):
+    with pytest.raises(ValidationException):
+        get_invoices_paginated(db_session, limit=2, cursor=0)
@@ -0,0 +1,67 @@
+"""Invoice creation, lookup and status rules."""
+
+import logging
+
+import pytest
+from sqlalchemy import inspect
+
+from app.core.exceptions import ValidationException
+from app.models.invoice import InvoiceStatus
+from app.services.invoice_service import (
+    ALLOWED_STATUS_TRANSITIONS,
+    get_invoice_by_id,
+    logger as invoice_logger,
+    validate_status_transition
+)
+
+
+def test_created_log_carries_client_name(make_invoice, sample_client, caplog):
+    with caplog.at_level(logging.INFO, logger=invoice_logger.name):
+        invoice = make_invoice()
+
+    (record,) = [
+        r for r in caplog.records
+        if r.getMessage().startswith(f"Invoice {invoice.id} created")
+    ]
+    assert record.client_name == sample_client.name
+    assert record.client_id == sample_client.id
+
+
+def test_get_invoice_by_id_eager_loads_relationships(db_session, make_invoice):
+    created = make_invoice()
+    db_session.expunge_all()
+
+    invoice, totals = get_invoice_by_id(created.id, db_session, track_view=False)
+
+    unloaded = inspect(invoice).unloaded
+    assert not {"client", "items", "payments"} & unloaded
+    assert invoice.client.name == "Ada Lovelace"
+    assert totals["vat_total"] == invoice.vat_total
+
+
+def test_each_view_increments_view_count(db_session, make_invoice):
+    created = make_invoice()
+
+    get_invoice_by_id(created.id, db_session)
+    invoice, _ = get_invoice_by_id(created.id, db_session)
+
+    assert invoice.view_count == 2
+    assert invoice.last_view is not None
+    db_session.expire_all()
+    assert invoice.view_count == 2
+
+
+def test_disallowed_status_transition_is_rejected():
+    validate_status_transition(InvoiceStatus.DRAFT, InvoiceStatus.SENT)
+    validate_status_transition(InvoiceStatus.PAID, InvoiceStatus.PAID)
+
+    with pytest.raises(ValidationException):
+        validate_status_transition(InvoiceStatus.DRAFT, InvoiceStatus.PAID)
+    with pytest.raises(ValidationException):
+        validate_status_transition(InvoiceStatus.CANCELLED, InvoiceStatus.SENT)
+
+
+def test_status_transition_table_is_read_only():
+    with pytest.raises(TypeError):
+        ALLOWED_STATUS_TRANSITIONS[InvoiceStatus.PAID] = frozenset(
+            {InvoiceStatus.CANCELLED})
@@ -0,0 +1,77 @@
+"""Persisted invoice.vat_total stays in step with the computed totals."""
+
+from decimal import Decimal
+
+from app.schemas.invoice import InvoiceUpdate
+from app.schemas.item import ItemCreate, ItemUpdate
+from app.services.invoice_service import get_invoice_by_id, update_invoice
+from app.services.item_service import add_item_to_invoice, delete_item, update_item
+from app.services.payment_service import calculate_remaining_balance
+from app.utils.invoice_utils import calculate_discount, calculate_invoice_totals
+
+
+def _assert_in_sync(db, invoice) -> None:
+    db.refresh(invoice)
+    assert invoice.vat_total == calculate_invoice_totals(invoice)["vat_total"]
+
+
+def test_vat_total_follows_item_writes(db_session, make_invoice):
+    invoice = make_invoice()
+    _assert_in_sync(db_session, invoice)
+    assert invoice.vat_total == Decimal("2150.00")
+
+    item = add_item_to_invoice(
+        invoice.id, ItemCreate(item_desc="Hosting", qty=1, rate=500), db_session)
+    _assert_in_sync(db_session, invoice)
+
+    update_item(item.id, ItemUpdate(qty=3), db_session)
+    _assert_in_sync(db_session, invoice)
+    assert invoice.vat_total == Decimal("3762.50")
+
+    delete_item(item.id, db_session)
+    _assert_in_sync(db_session, invoice)
+    assert invoice.vat_total == Decimal("2150.00")
+
+
+def test_vat_total_follows_discount_update(db_session, make_invoice):
+    invoice = make_invoice()
+
+    update_invoice(
+        invoice.id,
+        InvoiceUpdate(disc_type="percent", disc_value="10"),
+        db_session
+    )
+    _assert_in_sync(db_session, invoice)
+    assert invoice.vat_total == Decimal("1935.00")
+
+
+def test_non_numeric_discount_counts_as_none():
+    assert calculate_discount("percent", "10%", Decimal("100")) == Decimal("0.00")
+    assert calculate_discount("fixed", "n/a", Decimal("100")) == Decimal("0.00")
+
+
+def test_totals_follow_discount_change_after_first_read(db_session, make_invoice):
+    invoice = make_invoice()
+    _, totals = get_invoice_by_id(invoice.id, db_session, track_view=False)
+    assert totals["vat_total"] == Decimal("2150.00")
+
+    update_invoice(
+        invoice.id,
+        InvoiceUpdate(disc_type="fixed", disc_value="150"),
+        db_session
+    )
+
+    # Same session, so the identity map hands back the same instance
+    _, totals = get_invoice_by_id(invoice.id, db_session, track_view=False)
+    assert totals["vat_total"] == Decimal("1988.75")
+    assert calculate_remaining_balance(invoice) == Decimal("1988.75")
+
+
+def test_balance_reads_unsaved_discount_change(db_session, make_invoice):
+    invoice = make_invoice()
+    assert calculate_remaining_balance(invoice) == Decimal("2150.00")
+
+    invoice.disc_type = "percent"
+    invoice.disc_value = "10"
+
+    assert calculate_remaining_balance(invoice) == Decimal("1935.00")
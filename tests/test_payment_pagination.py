@@ -0,0 +1,72 @@
+"""Offset and cursor pagination of the payment list."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.exceptions import NotFoundException
+from app.models.payment import PaymentMode, PaymentStatus
+from app.schemas.payment import PaymentCreate
+from app.services.payment_service import create_payment, get_payments_paginated
+
+
+@pytest.fixture
+def payment_ids(db_session, make_invoice):
+    """Five payments, newest first, as the list orders them."""
+
+    invoice = make_invoice()
+    ids = [
+        create_payment(PaymentCreate(
+            client_name="Ada Lovelace",
+            payment_mode=PaymentMode.CASH,
+            payment_date=datetime.now(),
+            amount_paid=Decimal("100.00"),
+            reference_number=f"RCPT-{n}",
+            status=PaymentStatus.COMPLETED,
+            invoice_id=invoice.id
+        ), db_session).id
+        for n in range(5)
+    ]
+    # Same-second date_created values tie, so id decides the order
+    return sorted(ids, reverse=True)
+
+
+def _ids(result: dict) -> list[int]:
+    return [payment.id for payment in result["payments"]]
+
+
+def test_first_page(db_session, payment_ids):
+    result = get_payments_paginated(db_session, page=1, limit=2)
+
+    assert _ids(result) == payment_ids[:2]
+    assert result["pagination"] == {
+        "page": 1,
+        "limit": 2,
+        "total": 5,
+        "total_pages": 3,
+        "next_cursor": payment_ids[1]
+    }
+
+
+def test_cursor_chain_keeps_global_totals(db_session, payment_ids):
+    first = get_payments_paginated(db_session, limit=2)
+    second = get_payments_paginated(
+        db_session, limit=2, cursor=first["pagination"]["next_cursor"])
+    last = get_payments_paginated(
+        db_session, limit=2, cursor=second["pagination"]["next_cursor"])
+
+    assert _ids(second) == payment_ids[2:4]
+    assert second["pagination"]["page"] == 2
+    assert second["pagination"]["total"] == 5
+    assert second["pagination"]["total_pages"] == 3
+
+    assert _ids(last) == payment_ids[4:]
+    assert last["pagination"]["page"] == 3
+    assert last["pagination"]["total"] == 5
+    assert last["pagination"]["next_cursor"] is None
+
+
+def test_unknown_cursor_is_not_found(db_session, payment_ids):
+    with pytest.raises(NotFoundException):
+        get_payments_paginated(db_session, limit=2, cursor=max(payment_ids) + 100)
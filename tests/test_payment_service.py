@@ -0,0 +1,113 @@
+"""Payment creation, reference uniqueness and invoice status updates."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.core.exceptions import ConflictException
+from app.models.invoice import InvoiceStatus
+from app.models.payment import Payment, PaymentMode, PaymentStatus
+from app.schemas.payment import PaymentCreate
+from app.services.payment_service import (
+    calculate_remaining_balance,
+    create_payment,
+    create_payment_and_update_invoice,
+    delete_payment_and_update_invoice
+)
+
+
+def _payment_data(
+    invoice_id: int,
+    reference_number: str | None,
+    amount_paid: Decimal = Decimal("500.00")
+) -> PaymentCreate:
+    return PaymentCreate(
+        client_name="Ada Lovelace",
+        payment_mode=PaymentMode.BANK_TRANSFER,
+        payment_date=datetime.now(),
+        amount_paid=amount_paid,
+        reference_number=reference_number,
+        status=PaymentStatus.COMPLETED,
+        invoice_id=invoice_id
+    )
+
+
+def test_duplicate_reference_is_a_conflict(db_session, make_invoice):
+    invoice = make_invoice()
+    create_payment(_payment_data(invoice.id, "TRF-001"), db_session)
+
+    with pytest.raises(ConflictException) as exc_info:
+        create_payment(_payment_data(invoice.id, "TRF-001"), db_session)
+
+    assert exc_info.value.code == "DUPLICATE_PAYMENT_REFERENCE"
+    assert db_session.query(Payment).count() == 1
+
+
+def test_same_reference_on_another_invoice_is_allowed(db_session, make_invoice):
+    first = make_invoice()
+    second = make_invoice()
+
+    create_payment(_payment_data(first.id, "TRF-001"), db_session)
+    create_payment(_payment_data(second.id, "TRF-001"), db_session)
+
+    assert db_session.query(Payment).count() == 2
+
+
+@pytest.mark.parametrize("reference_number", ["", None])
+def test_blank_references_are_not_unique(db_session, make_invoice, reference_number):
+    invoice = make_invoice()
+
+    create_payment(_payment_data(invoice.id, reference_number), db_session)
+    create_payment(_payment_data(invoice.id, reference_number), db_session)
+
+    assert db_session.query(Payment)\
+        .filter(Payment.invoice_id == invoice.id)\
+        .count() == 2
+
+
+@pytest.fixture
+def queued_tasks(monkeypatch):
+    """Record Celery sends instead of publishing them."""
+
+    from app.core.celery_app import celery_app
+
+    sent = []
+    monkeypatch.setattr(
+        celery_app, "send_task", lambda name, args=None, **kw: sent.append((name, args)))
+    return sent
+
+
+def test_payments_move_invoice_through_paid_states(db_session, make_invoice, queued_tasks):
+    invoice = make_invoice()  # vat_total 2150.00
+
+    first = create_payment_and_update_invoice(
+        _payment_data(invoice.id, "TRF-001", Decimal("1000.00")), db_session)
+    db_session.refresh(invoice)
+    assert invoice.status == InvoiceStatus.PARTIALLY_PAID
+
+    second = create_payment_and_update_invoice(
+        _payment_data(invoice.id, "TRF-002", Decimal("1150.00")), db_session)
+    db_session.refresh(invoice)
+    assert invoice.status == InvoiceStatus.PAID
+    assert queued_tasks == [
+        ("email.send_payment_confirmation", [first.id]),
+        ("email.send_payment_confirmation", [second.id]),
+    ]
+
+    delete_payment_and_update_invoice(second.id, db_session)
+    db_session.refresh(invoice)
+    assert invoice.status == InvoiceStatus.PARTIALLY_PAID
+    assert calculate_remaining_balance(invoice) == Decimal("1150.00")
+
+
+def test_cancelled_payment_leaves_invoice_unpaid(db_session, make_invoice, queued_tasks):
+    invoice = make_invoice()
+    data = _payment_data(invoice.id, "TRF-001", Decimal("2150.00"))
+    data.status = PaymentStatus.CANCELLED
+
+    create_payment_and_update_invoice(data, db_session)
+    db_session.refresh(invoice)
+
+    assert invoice.status == InvoiceStatus.DRAFT
+    assert calculate_remaining_balance(invoice) == Decimal("2150.00")